@@ -8,31 +8,41 @@ Output: augmented JSONL with the same schema as the input.
 """
 
 import argparse
+import hashlib
 import json
 import random
 import re
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 
 WORDLISTS_DIR = Path(__file__).parent / "wordlists"
 
 
-def load_wordlist(name: str) -> list[str]:
-    """Load a wordlist from training/wordlists/{name}.txt (one entry per line)."""
+def load_wordlist(name: str) -> tuple[str, ...]:
+    """Load a wordlist from training/wordlists/{name}.txt (one entry per line).
+
+    Entries never contain whitespace, so a plain split() also drops blank
+    lines and stray indentation.
+    """
     path = WORDLISTS_DIR / f"{name}.txt"
     if not path.exists():
         raise FileNotFoundError(
             f"Wordlist {path} not found. Run fetch_wordlists.py first."
         )
-    entries = [line.strip() for line in path.read_text().splitlines() if line.strip()]
-    return entries
+    return tuple(path.read_text().split())
 
 
 # ---------------------------------------------------------------------------
 # Replacement pools
-# Inline lists for small/specialized pools, wordlist files for large ones
+# Inline tuples for small/specialized pools, wordlist files for large ones
 # ---------------------------------------------------------------------------
 
-BRANCHES = [
+BRANCHES = (
     # main-line
     "main", "master", "develop", "staging", "production", "trunk",
     "release", "stable", "nightly", "canary",
@@ -66,7 +76,7 @@ BRANCHES = [
     # user-prefixed
     "alice/feature-login", "bob/fix-crash", "dev/experiment",
     "user/wip", "alice/refactor", "bob/hotfix",
-]
+)
 
 PACKAGES = (
     load_wordlist("packages-python")
@@ -74,15 +84,15 @@ PACKAGES = (
     + load_wordlist("packages-rust")
 )
 
-USERNAMES = [
+USERNAMES = (
     "alice", "bob", "charlie", "dave", "eve", "frank", "grace",
     "henry", "iris", "jack", "kate", "leo", "mia", "noah",
     "dev", "admin", "deploy", "user", "root", "ubuntu",
     "ec2-user", "jenkins", "ci", "github-actions", "runner",
     "webapp", "api", "worker", "scheduler", "monitor",
-]
+)
 
-HOSTNAMES = [
+HOSTNAMES = (
     "localhost", "server01", "server02", "server03",
     "prod-web-1", "prod-web-2", "prod-db-1",
     "staging.example.com", "dev.example.com",
@@ -91,16 +101,16 @@ HOSTNAMES = [
     "172.16.0.1", "my-server.cloud", "node-1.cluster.local",
     "node-2.cluster.local", "bastion.example.com",
     "jump.internal", "vpn.example.com",
-]
+)
 
-PORTS = [
+PORTS = (
     "80", "443", "3000", "3001", "3306", "4000", "4200",
     "5000", "5001", "5173", "5432", "6379", "6380",
     "8000", "8080", "8081", "8443", "8888", "9000",
     "9090", "9200", "9300", "27017", "27018",
-]
+)
 
-FILE_PATHS = [
+FILE_PATHS = (
     # Python
     "src/main.py", "src/app.py", "src/server.py", "src/cli.py",
     "app/models.py", "app/views.py", "app/controllers.py",
@@ -129,9 +139,9 @@ FILE_PATHS = [
     "package.json", "Cargo.toml", "pyproject.toml",
     # Docs
     "docs/README.md", "README.md", "CHANGELOG.md",
-]
+)
 
-DIR_PATHS = [
+DIR_PATHS = (
     "projects/new-app", "projects/my-service", "projects/api",
     "src/components", "src/modules", "src/utils",
     "backend/api", "backend/services", "backend/workers",
@@ -145,13 +155,13 @@ DIR_PATHS = [
     "data/output", "data/input", "data/raw", "data/processed",
     "models/checkpoints", "models/weights", "models/cache",
     "logs/app", "logs/access", "logs/error",
-]
+)
 
 # SSH key file variants
-SSH_KEY_FILES = [
+SSH_KEY_FILES = (
     "id_rsa", "id_ed25519", "id_ecdsa", "id_dsa",
     "deploy_key", "github_key", "work_key",
-]
+)
 
 DOCKER_IMAGES = load_wordlist("docker-images")
 
@@ -176,24 +186,24 @@ COMMANDS_TYPOS = {
 }
 
 # Service names for systemctl/service commands
-SERVICES = [
+SERVICES = (
     "nginx", "apache2", "httpd", "postgresql", "mysql", "mariadb",
     "redis", "mongodb", "elasticsearch", "rabbitmq",
     "docker", "containerd", "kubernetes",
     "sshd", "fail2ban", "ufw", "firewalld",
     "cron", "crond", "atd",
     "NetworkManager", "systemd-resolved", "avahi-daemon",
-]
+)
 
 # Error message formatting variants (for slight output variation)
-BASH_SHELLS = ["bash", "zsh", "fish", "sh"]
+BASH_SHELLS = ("bash", "zsh", "fish", "sh")
 
 REPO_NAMES = load_wordlist("repo-names")
 
 GITHUB_USERS = load_wordlist("github-users")
 
 # Generic script/file names used in runtime errors
-SCRIPT_NAMES = [
+SCRIPT_NAMES = (
     "app.py", "server.py", "main.py", "script.py", "run.py",
     "manage.py", "cli.py", "worker.py", "train.py", "test.py",
     "setup.py", "build.py", "deploy.py", "migrate.py", "seed.py",
@@ -201,179 +211,331 @@ SCRIPT_NAMES = [
     "app.ts", "server.ts", "index.ts", "main.ts",
     "main.rs", "lib.rs", "server.rs",
     "main.go", "server.go", "handler.go",
-]
+)
 
 # Generic binary/program names for "command not found" gibberish negatives
-GIBBERISH_CMDS = [
+GIBBERISH_CMDS = (
     "asdfghjkl", "qwertyuiop", "zxcvbnm", "xyzzy", "qqq",
     "flibbertigibbet", "blorgzorp", "fnorble", "greeble", "slargh",
     "wumpus", "thingamajig", "doohickey", "whatchamacallit", "thingummy",
     "frobnicator", "blorpify", "quuxify", "nooble", "plonker",
     "splunge", "furtle", "snorble", "worble", "glorp",
-]
+)
 
 # Process IDs for kill/ps errors
-PROCESS_IDS = [str(i) for i in [
+PROCESS_IDS = tuple(str(i) for i in (
     1234, 2345, 3456, 4567, 5678, 6789, 7890, 8901, 9012,
     10234, 11345, 12456, 13567, 14678, 15789, 16890, 17901,
     99999, 88888, 77777, 66666, 55555,
-]]
+))
 
 # Line numbers for syntax errors
-LINE_NUMBERS = [str(i) for i in range(1, 101)]
+LINE_NUMBERS = tuple(str(i) for i in range(1, 101))
 
 # Commit messages
-COMMIT_MESSAGES = [
+COMMIT_MESSAGES = (
     "fix bug", "add feature", "update deps", "refactor code",
     "fix typo", "add tests", "update readme", "initial commit",
     "wip", "cleanup", "hotfix", "add logging", "fix crash",
     "improve performance", "add validation", "fix lint errors",
     "add docs", "bump version", "fix tests", "merge conflicts",
-]
+)
 
 # File extensions for generic file references
-FILE_EXTENSIONS = [
+FILE_EXTENSIONS = (
     ".py", ".js", ".ts", ".rs", ".go", ".rb", ".java", ".cpp",
     ".yaml", ".yml", ".json", ".toml", ".conf", ".cfg", ".ini",
     ".txt", ".log", ".csv", ".md", ".sh", ".bash",
-]
+)
 
 # Generic directory names (short, single-segment) for cd/mkdir errors
-GENERIC_DIRS = [
+GENERIC_DIRS = (
     "mydir", "newdir", "testdir", "tmpdir", "builddir", "outdir",
     "src", "lib", "bin", "dist", "build", "output", "cache",
     "uploads", "downloads", "backup", "archive", "logs", "tmp",
     "workspace", "project", "app", "service", "module",
-]
+)
 
 # IP addresses
-IP_ADDRESSES = [
+IP_ADDRESSES = (
     "192.168.1.1", "192.168.1.100", "192.168.0.1", "192.168.0.10",
     "10.0.0.1", "10.0.0.5", "10.0.0.10", "10.0.1.1",
     "172.16.0.1", "172.16.1.10", "127.0.0.1",
     "203.0.113.1", "198.51.100.2", "198.18.0.5",
-]
+)
 
 SYSTEM_PACKAGES = load_wordlist("system-packages")
 
 
+# ---------------------------------------------------------------------------
+# Precompiled patterns and pool matchers
+# Built once at import; augment_example runs millions of times on
+# --target-count runs and the wordlist pools are thousands of entries long.
+# ---------------------------------------------------------------------------
+
+def _is_word_boundary(text: str, pos: int) -> bool:
+    """Return True if `pos` sits on a regex \\b boundary in `text`."""
+    before = pos > 0 and (text[pos - 1].isalnum() or text[pos - 1] == "_")
+    after = pos < len(text) and (text[pos].isalnum() or text[pos] == "_")
+    return before != after
+
+
+class PoolMatcher:
+    """Find whole-word occurrences of replacement pool entries.
+
+    Equivalent to ``re.findall(r"\\b(e1|e2|...)\\b", text)`` over the
+    concatenated pools with the alternatives sorted longest first, so
+    "python3-pip" is preferred over its prefix "python3". Candidate substrings
+    are looked up in a dict instead of trying every alternative at every
+    offset, so the cost scales with the text rather than with the (thousands
+    of entries long) pools.
+
+    Each hit is reported together with the pool it came from; an entry listed
+    in several pools belongs to the first one.
+    """
+
+    def __init__(self, *pools: tuple[str, ...]):
+        self._pool: dict[str, tuple[str, ...]] = {}
+        for pool in pools:
+            for entry in pool:
+                if entry:
+                    self._pool.setdefault(entry, pool)
+        self._lengths = sorted({len(entry) for entry in self._pool}, reverse=True)
+        # Every entry lies inside a run of these characters, so only those
+        # runs need to be examined.
+        chars = sorted(set("".join(self._pool)))
+        self._run_pattern = re.compile(
+            "[" + "".join(re.escape(c) for c in chars) + "]+"
+        )
+
+    def findall(self, text: str) -> list[tuple[str, tuple[str, ...]]]:
+        """Return non-overlapping (entry, pool) hits, scanning left to right."""
+        hits = []
+        for run in self._run_pattern.finditer(text):
+            pos, run_end = run.span()
+            while pos < run_end:
+                entry = self._match_at(text, pos, run_end)
+                if entry is None:
+                    pos += 1
+                else:
+                    hits.append((entry, self._pool[entry]))
+                    pos += len(entry)
+        return hits
+
+    def _match_at(self, text: str, pos: int, run_end: int) -> str | None:
+        if not _is_word_boundary(text, pos):
+            return None
+        for length in self._lengths:
+            end = pos + length
+            if end <= run_end and text[pos:end] in self._pool and _is_word_boundary(text, end):
+                return text[pos:end]
+        return None
+
+
+BRANCH_PATTERN = re.compile(
+    r"\b(feature[-/]\w[\w-]*|fix[-/]\w[\w-]*|hotfix[-/]\w[\w-]*"
+    r"|release[-/][\w.]+|refactor[-/]\w[\w-]*|chore[-/]\w[\w-]*"
+    r"|ci[-/]\w[\w-]*|test[-/]\w[\w-]*|docs[-/]\w[\w-]*"
+    r"|main|master|develop|staging|production|trunk|stable)\b"
+)
+# System package names are only replaced when they appear in the command.
+COMMAND_NAME_MATCHER = PoolMatcher(PACKAGES, SYSTEM_PACKAGES, SERVICES, DOCKER_IMAGES)
+CORRECTION_NAME_MATCHER = PoolMatcher(PACKAGES, SERVICES, DOCKER_IMAGES)
+USER_HOST_PATTERN = re.compile(r"(\w[\w-]*)@([\w.\-]+)")
+PORT_PATTERN = re.compile(r":(\d{2,5})\b")
+BARE_PORT_PATTERN = re.compile(r"\b(3000|5000|8080|8000|4000|3001)\b")
+SSH_KEY_PATTERN = re.compile("(" + "|".join(map(re.escape, SSH_KEY_FILES)) + ")")
+TAG_PATTERN = re.compile(r"\bv(\d+)\.(\d+)\.(\d+)\b")
+GH_URL_PATTERN = re.compile(r"github\.com[:/]([\w-]+)/([\w.-]+)")
+SHELL_PREFIX_PATTERN = re.compile(r"^(bash|zsh|sh|fish): ", re.MULTILINE)
+HASH_PATTERN = re.compile(r"\b([0-9a-f]{7,40})\b")
+PID_PATTERN = re.compile(r"\b(99999|88888|77777|66666|55555|\d{4,6})\b")
+IP_PATTERN = re.compile(r"\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b")
+LINENO_PATTERN = re.compile(r"\bline (\d+)\b")
+COMMIT_MSG_PATTERN = re.compile(r"git commit -m '([^']+)'")
+CNF_PATTERN = re.compile(r"^(\S+): command not found", re.MULTILINE)
+TRAILING_SLASH_PATTERN = re.compile(r"\b(src|dist|build|lib|bin|tmp)\b(?!/)")
+
+
 # ---------------------------------------------------------------------------
 # Augmentation helpers
 # ---------------------------------------------------------------------------
 
-def _replace_all(text: str, old: str, new: str) -> str:
-    """Replace all occurrences, case-insensitively preserving original case pattern."""
-    return text.replace(old, new)
+def _substitute(texts: tuple[str, ...], replacements: dict[str, str]) -> tuple[str, ...]:
+    """Apply all old -> new replacements to each text in a single pass.
+
+    Replacements are simultaneous: text inserted for one token is never
+    rewritten by a later one, unlike chained str.replace calls. Longer tokens
+    win where two overlap.
+    """
+    if len(replacements) == 1:
+        [(old, new)] = replacements.items()
+        return tuple(text.replace(old, new) for text in texts)
+    pattern = _alternation(tuple(replacements))
+    return tuple(pattern.sub(lambda m: replacements[m.group(0)], text) for text in texts)
+
+
+@lru_cache(maxsize=4096)
+def _alternation(tokens: tuple[str, ...]) -> re.Pattern:
+    """Compile a longest-first alternation of literal tokens."""
+    return re.compile("|".join(
+        re.escape(token) for token in sorted(tokens, key=len, reverse=True)
+    ))
+
+
+# Unknown commands in "command not found" errors that are deliberate typos of
+# real tools; those stay as-is rather than being swapped for gibberish.
+KNOWN_TYPOS = {
+    "gti", "sl", "pytohn", "ndoe", "dcoker", "kubeclt",
+    "teh", "grpe", "maek", "carog", "dc",
+}
+
+
+@dataclass(frozen=True)
+class Analysis:
+    """What augment_example can vary in a base example.
+
+    Everything here depends only on the example's text, not on the RNG, so it
+    is computed once per base example and reused for every variation.
+    """
+    branches: tuple[str, ...]
+    packages: tuple[str, ...]
+    system_packages: tuple[str, ...]
+    services: tuple[str, ...]
+    docker_images: tuple[str, ...]
+    # (pool, entry) for the first entry of each path/script pool found
+    path_hits: tuple[tuple[tuple[str, ...], str], ...]
+    user_host: str | None
+    port: str | None
+    bare_port: str | None
+    ssh_key: str | None
+    has_tag: bool
+    has_gh_url: bool
+    has_shell_prefix: bool
+    has_hash: bool
+    pid: str | None
+    ip: str | None
+    has_lineno: bool
+    has_commit_msg: bool
+    cnf_token: str | None
+    has_trailing_slash_dir: bool
+
+    def can_vary(self) -> bool:
+        """Whether any section applies, i.e. a variation can differ at all."""
+        return any(getattr(self, f.name) for f in fields(self))
+
+
+@lru_cache(maxsize=None)
+def _analyze(cmd: str, stderr: str, correction: str) -> Analysis:
+    """Find every replaceable token in an example's fields."""
+    name_hits = COMMAND_NAME_MATCHER.findall(cmd) + CORRECTION_NAME_MATCHER.findall(correction)
+
+    def names_from(pool: tuple[str, ...]) -> tuple[str, ...]:
+        return tuple(dict.fromkeys(name for name, hit_pool in name_hits if hit_pool is pool))
+
+    # Each path/script pool replaces only the first of its entries found (in
+    # pool order), to avoid cascade confusion. The fields are searched as one
+    # NUL-joined haystack so an entry can't match across a field boundary;
+    # generic dir names only look at the command and stderr.
+    haystack = "\0".join((cmd, stderr, correction))
+    head = haystack[:len(cmd) + 1 + len(stderr)]
+    path_hits = []
+    for pool, text in (
+        (FILE_PATHS, haystack),
+        (DIR_PATHS, haystack),
+        (GENERIC_DIRS, head),
+        (SCRIPT_NAMES, haystack),
+    ):
+        for old in pool:
+            if old in text:
+                path_hits.append((pool, old))
+                break
+
+    user_host = USER_HOST_PATTERN.search(cmd)
+    port = PORT_PATTERN.search(cmd)
+    bare_port = BARE_PORT_PATTERN.search(cmd) if ":" not in cmd else None
+    ssh_key = SSH_KEY_PATTERN.search(stderr) or SSH_KEY_PATTERN.search(correction)
+    pid = PID_PATTERN.search(cmd) if "kill" in cmd else None
+    ip = IP_PATTERN.search(cmd) or IP_PATTERN.search(stderr)
+
+    # Only replace "command not found" tokens that are clearly gibberish (not
+    # a real tool name we care about)
+    cnf = CNF_PATTERN.search(stderr) if correction == "?" else None
+    cnf_token = cnf and cnf.group(1)
+    if cnf_token and cnf_token not in GIBBERISH_CMDS and cnf_token in KNOWN_TYPOS:
+        cnf_token = None
+
+    return Analysis(
+        branches=tuple(dict.fromkeys(
+            BRANCH_PATTERN.findall(cmd) + BRANCH_PATTERN.findall(stderr)
+        )),
+        packages=names_from(PACKAGES),
+        system_packages=names_from(SYSTEM_PACKAGES),
+        services=names_from(SERVICES),
+        docker_images=names_from(DOCKER_IMAGES),
+        path_hits=tuple(path_hits),
+        user_host=user_host and user_host.group(0),
+        port=port and port.group(1),
+        bare_port=bare_port and bare_port.group(1),
+        ssh_key=ssh_key and ssh_key.group(1),
+        has_tag=bool(TAG_PATTERN.search(cmd) or TAG_PATTERN.search(stderr)),
+        has_gh_url=bool(GH_URL_PATTERN.search(cmd) or GH_URL_PATTERN.search(stderr)),
+        has_shell_prefix=bool(SHELL_PREFIX_PATTERN.search(stderr)),
+        has_hash=bool(HASH_PATTERN.search(stderr) or HASH_PATTERN.search(correction)),
+        pid=pid and pid.group(1),
+        ip=ip and ip.group(1),
+        has_lineno=bool(LINENO_PATTERN.search(stderr)),
+        has_commit_msg=bool(COMMIT_MSG_PATTERN.search(cmd)),
+        cnf_token=cnf_token,
+        has_trailing_slash_dir=bool(TRAILING_SLASH_PATTERN.search(cmd)),
+    )
 
 
 def augment_example(example: dict, rng: random.Random) -> dict:
     """Create a single augmented variation of an example.
 
     Performs random substitutions of identifiable patterns in the command,
-    stderr, and correction fields.
+    stderr, and correction fields. Tokens are located once per base example
+    (see _analyze); only the random choices differ between variations.
     """
     cmd = example["command"]
     stderr = example["stderr"]
     correction = example["correction"]
-
-    # ---- branch names ----
-    branch_pattern = re.compile(
-        r"\b(feature[-/]\w[\w-]*|fix[-/]\w[\w-]*|hotfix[-/]\w[\w-]*"
-        r"|release[-/][\w.]+|refactor[-/]\w[\w-]*|chore[-/]\w[\w-]*"
-        r"|ci[-/]\w[\w-]*|test[-/]\w[\w-]*|docs[-/]\w[\w-]*"
-        r"|main|master|develop|staging|production|trunk|stable)\b"
-    )
-    if branch_pattern.search(cmd) or branch_pattern.search(stderr):
-        old_branches = list(dict.fromkeys(
-            branch_pattern.findall(cmd) + branch_pattern.findall(stderr)
-        ))
-        for old in old_branches:
-            new_branch = rng.choice(BRANCHES)
-            cmd = cmd.replace(old, new_branch)
-            stderr = stderr.replace(old, new_branch)
-            correction = correction.replace(old, new_branch)
-
-    # ---- package names ----
-    pkg_pattern = re.compile(
-        r"\b(" + "|".join(re.escape(p) for p in PACKAGES) + r")\b"
-    )
-    if pkg_pattern.search(cmd) or pkg_pattern.search(correction):
-        matches = list(dict.fromkeys(
-            pkg_pattern.findall(cmd) + pkg_pattern.findall(correction)
-        ))
-        for old_pkg in matches:
-            new_pkg = rng.choice(PACKAGES)
-            cmd = cmd.replace(old_pkg, new_pkg)
-            stderr = stderr.replace(old_pkg, new_pkg)
-            correction = correction.replace(old_pkg, new_pkg)
-
-    # ---- system package names (apt/pacman/brew) ----
-    sys_pkg_pattern = re.compile(
-        r"\b(" + "|".join(re.escape(p) for p in SYSTEM_PACKAGES) + r")\b"
-    )
-    if sys_pkg_pattern.search(cmd):
-        matches = list(dict.fromkeys(sys_pkg_pattern.findall(cmd)))
-        for old_pkg in matches:
-            new_pkg = rng.choice(SYSTEM_PACKAGES)
-            cmd = cmd.replace(old_pkg, new_pkg)
-            stderr = stderr.replace(old_pkg, new_pkg)
-            correction = correction.replace(old_pkg, new_pkg)
-
-    # ---- file paths ----
-    for old_path in FILE_PATHS:
-        if old_path in stderr or old_path in cmd or old_path in correction:
-            new_path = rng.choice(FILE_PATHS)
-            cmd = cmd.replace(old_path, new_path)
-            stderr = stderr.replace(old_path, new_path)
-            correction = correction.replace(old_path, new_path)
-            break  # replace first match only, avoid cascade confusion
-
-    # ---- directory paths ----
-    for old_dir in DIR_PATHS:
-        if old_dir in stderr or old_dir in cmd or old_dir in correction:
-            new_dir = rng.choice(DIR_PATHS)
-            cmd = cmd.replace(old_dir, new_dir)
-            stderr = stderr.replace(old_dir, new_dir)
-            correction = correction.replace(old_dir, new_dir)
-            break
-
-    # ---- generic single-word dir names (cd/mkdir errors) ----
-    for old_dir in GENERIC_DIRS:
-        if old_dir in cmd or old_dir in stderr:
-            new_dir = rng.choice(GENERIC_DIRS)
-            cmd = cmd.replace(old_dir, new_dir)
-            stderr = stderr.replace(old_dir, new_dir)
-            correction = correction.replace(old_dir, new_dir)
-            break
-
-    # ---- script names ----
-    for old_script in SCRIPT_NAMES:
-        if old_script in cmd or old_script in stderr or old_script in correction:
-            new_script = rng.choice(SCRIPT_NAMES)
-            cmd = cmd.replace(old_script, new_script)
-            stderr = stderr.replace(old_script, new_script)
-            correction = correction.replace(old_script, new_script)
-            break
-
-    # ---- user@host patterns ----
-    user_host_pattern = re.compile(r"(\w[\w-]*)@([\w.\-]+)")
-    match = user_host_pattern.search(cmd)
-    if match:
-        old_user, old_host = match.group(1), match.group(2)
-        new_user = rng.choice(USERNAMES)
-        new_host = rng.choice(HOSTNAMES)
-        cmd = cmd.replace(f"{old_user}@{old_host}", f"{new_user}@{new_host}")
-        stderr = stderr.replace(f"{old_user}@{old_host}", f"{new_user}@{new_host}")
-        correction = correction.replace(f"{old_user}@{old_host}", f"{new_user}@{new_host}")
+    found = _analyze(cmd, stderr, correction)
+
+    # ---- literal tokens: branches, names, paths, user@host, IPs ----
+    # These are all fixed strings found by _analyze, so their replacements are
+    # collected first and applied in one simultaneous pass per field. If two
+    # sections found the same token, the earlier one's choice is kept.
+    replacements: dict[str, str] = {}
+    for hits, pool in (
+        (found.branches, BRANCHES),
+        (found.packages, PACKAGES),
+        (found.system_packages, SYSTEM_PACKAGES),  # apt/pacman/brew
+        (found.services, SERVICES),
+        (found.docker_images, DOCKER_IMAGES),
+    ):
+        for old in hits:
+            replacements.setdefault(old, rng.choice(pool))
+    # file paths, directory paths, generic dir names, script names
+    for pool, old in found.path_hits:
+        replacements.setdefault(old, rng.choice(pool))
+    if found.user_host:
+        replacements.setdefault(
+            found.user_host, f"{rng.choice(USERNAMES)}@{rng.choice(HOSTNAMES)}"
+        )
+    if found.ip:
+        replacements.setdefault(found.ip, rng.choice(IP_ADDRESSES))
+    if replacements:
+        cmd, stderr, correction = _substitute((cmd, stderr, correction), replacements)
 
     # ---- port numbers ----
-    port_pattern = re.compile(r":(\d{2,5})\b")
-    port_match = port_pattern.search(cmd)
-    if port_match:
-        old_port = port_match.group(1)
+    if found.port:
+        old_port = found.port
         new_port = rng.choice(PORTS)
-        cmd = re.sub(r":" + re.escape(old_port) + r"\b", f":{new_port}", cmd)
-        stderr = re.sub(r":" + re.escape(old_port) + r"\b", f":{new_port}", stderr)
+        old_port_pattern = re.compile(r":" + re.escape(old_port) + r"\b")
+        cmd = old_port_pattern.sub(f":{new_port}", cmd)
+        stderr = old_port_pattern.sub(f":{new_port}", stderr)
         if correction != "?":
             try:
                 old_port_int = int(old_port)
@@ -381,80 +543,42 @@ def augment_example(example: dict, rng: random.Random) -> dict:
                 correction = correction.replace(
                     str(old_port_int + 1), str(new_port_int + 1)
                 )
-                correction = re.sub(
-                    r":" + re.escape(old_port) + r"\b", f":{new_port}", correction
-                )
+                correction = old_port_pattern.sub(f":{new_port}", correction)
             except ValueError:
-                correction = re.sub(
-                    r":" + re.escape(old_port) + r"\b", f":{new_port}", correction
-                )
+                correction = old_port_pattern.sub(f":{new_port}", correction)
 
     # ---- standalone port numbers (e.g. "fuser -k 3000/tcp") ----
-    bare_port_pattern = re.compile(r"\b(3000|5000|8080|8000|4000|3001)\b")
-    bp_match = bare_port_pattern.search(cmd)
-    if bp_match and ":" not in cmd:
-        old_port = bp_match.group(1)
+    if found.bare_port:
+        old_port = found.bare_port
         new_port = rng.choice(PORTS)
-        cmd = re.sub(r"\b" + re.escape(old_port) + r"\b", new_port, cmd)
-        stderr = re.sub(r"\b" + re.escape(old_port) + r"\b", new_port, stderr)
+        old_port_pattern = re.compile(r"\b" + re.escape(old_port) + r"\b")
+        cmd = old_port_pattern.sub(new_port, cmd)
+        stderr = old_port_pattern.sub(new_port, stderr)
         if correction != "?":
-            correction = re.sub(r"\b" + re.escape(old_port) + r"\b", new_port, correction)
+            correction = old_port_pattern.sub(new_port, correction)
 
     # ---- SSH key file names ----
-    ssh_key_pattern = re.compile(r"(id_rsa|id_ed25519|id_ecdsa|id_dsa|deploy_key|github_key|work_key)")
-    ssh_search = ssh_key_pattern.search(stderr) or ssh_key_pattern.search(correction)
-    if ssh_search:
-        old_key = ssh_search.group(1)
+    if found.ssh_key:
         new_key = rng.choice(SSH_KEY_FILES)
-        stderr = stderr.replace(old_key, new_key)
-        correction = correction.replace(old_key, new_key)
-
-    # ---- service names ----
-    service_pattern = re.compile(
-        r"\b(" + "|".join(re.escape(s) for s in SERVICES) + r")\b"
-    )
-    if service_pattern.search(cmd) or service_pattern.search(correction):
-        svc_matches = list(dict.fromkeys(
-            service_pattern.findall(cmd) + service_pattern.findall(correction)
-        ))
-        for old_svc in svc_matches:
-            new_svc = rng.choice(SERVICES)
-            cmd = cmd.replace(old_svc, new_svc)
-            stderr = stderr.replace(old_svc, new_svc)
-            correction = correction.replace(old_svc, new_svc)
-
-    # ---- docker image names ----
-    docker_img_pattern = re.compile(
-        r"\b(" + "|".join(re.escape(i) for i in DOCKER_IMAGES) + r")\b"
-    )
-    if docker_img_pattern.search(cmd) or docker_img_pattern.search(correction):
-        img_matches = list(dict.fromkeys(
-            docker_img_pattern.findall(cmd) + docker_img_pattern.findall(correction)
-        ))
-        for old_img in img_matches:
-            new_img = rng.choice(DOCKER_IMAGES)
-            cmd = cmd.replace(old_img, new_img)
-            stderr = stderr.replace(old_img, new_img)
-            correction = correction.replace(old_img, new_img)
+        stderr = stderr.replace(found.ssh_key, new_key)
+        correction = correction.replace(found.ssh_key, new_key)
 
     # ---- git tag versions ----
-    tag_pattern = re.compile(r"\bv(\d+)\.(\d+)\.(\d+)\b")
-    if tag_pattern.search(cmd) or tag_pattern.search(stderr):
+    if found.has_tag:
         major = rng.randint(0, 5)
         minor = rng.randint(0, 20)
         patch = rng.randint(0, 10)
         new_tag = f"v{major}.{minor}.{patch}"
-        cmd = tag_pattern.sub(new_tag, cmd)
-        stderr = tag_pattern.sub(new_tag, stderr)
-        correction = tag_pattern.sub(new_tag, correction)
+        cmd = TAG_PATTERN.sub(new_tag, cmd)
+        stderr = TAG_PATTERN.sub(new_tag, stderr)
+        correction = TAG_PATTERN.sub(new_tag, correction)
 
     # ---- github user/repo in URLs ----
-    gh_url_pattern = re.compile(r"github\.com[:/]([\w-]+)/([\w.-]+)")
-    if gh_url_pattern.search(cmd) or gh_url_pattern.search(stderr):
+    if found.has_gh_url:
         new_gh_user = rng.choice(GITHUB_USERS)
         new_repo = rng.choice(REPO_NAMES)
         def replace_gh(text):
-            return gh_url_pattern.sub(
+            return GH_URL_PATTERN.sub(
                 lambda m: m.group(0)
                     .replace(m.group(1), new_gh_user)
                     .replace(m.group(2), new_repo + ".git"),
@@ -465,70 +589,49 @@ def augment_example(example: dict, rng: random.Random) -> dict:
         correction = replace_gh(correction)
 
     # ---- shell name in error messages (bash: → zsh:) ----
-    shell_prefix = re.compile(r"^(bash|zsh|sh|fish): ", re.MULTILINE)
-    if shell_prefix.search(stderr) and rng.random() < 0.5:
+    if found.has_shell_prefix and rng.random() < 0.5:
         new_shell = rng.choice(BASH_SHELLS)
-        stderr = shell_prefix.sub(f"{new_shell}: ", stderr)
+        stderr = SHELL_PREFIX_PATTERN.sub(f"{new_shell}: ", stderr)
 
     # ---- vary commit hash snippets ----
-    hash_pattern = re.compile(r"\b([0-9a-f]{7,40})\b")
-    if hash_pattern.search(stderr) or hash_pattern.search(correction):
+    if found.has_hash:
         new_hash = format(rng.randint(0, 0xFFFFFFFF), '07x')
-        stderr = hash_pattern.sub(new_hash, stderr)
-        correction = hash_pattern.sub(new_hash, correction)
+        stderr = HASH_PATTERN.sub(new_hash, stderr)
+        correction = HASH_PATTERN.sub(new_hash, correction)
 
     # ---- process IDs in kill / ps errors ----
-    pid_pattern = re.compile(r"\b(99999|88888|77777|66666|55555|\d{4,6})\b")
-    if "kill" in cmd and pid_pattern.search(cmd):
-        old_pid = pid_pattern.search(cmd).group(1)
+    if found.pid:
         new_pid = rng.choice(PROCESS_IDS)
-        cmd = cmd.replace(old_pid, new_pid)
-        stderr = stderr.replace(old_pid, new_pid)
-
-    # ---- IP addresses ----
-    ip_pattern = re.compile(r"\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b")
-    if ip_pattern.search(cmd) or ip_pattern.search(stderr):
-        old_ip = (ip_pattern.search(cmd) or ip_pattern.search(stderr)).group(1)
-        new_ip = rng.choice(IP_ADDRESSES)
-        cmd = cmd.replace(old_ip, new_ip)
-        stderr = stderr.replace(old_ip, new_ip)
-        correction = correction.replace(old_ip, new_ip)
+        cmd = cmd.replace(found.pid, new_pid)
+        stderr = stderr.replace(found.pid, new_pid)
 
     # ---- line numbers in error messages ----
-    lineno_pattern = re.compile(r"\bline (\d+)\b")
-    if lineno_pattern.search(stderr):
+    if found.has_lineno:
         new_lineno = rng.choice(LINE_NUMBERS)
-        stderr = lineno_pattern.sub(f"line {new_lineno}", stderr)
+        stderr = LINENO_PATTERN.sub(f"line {new_lineno}", stderr)
 
     # ---- commit message text in git commit commands ----
-    commit_msg_pattern = re.compile(r"git commit -m '([^']+)'")
-    if commit_msg_pattern.search(cmd):
+    if found.has_commit_msg:
         new_msg = rng.choice(COMMIT_MESSAGES)
-        cmd = commit_msg_pattern.sub(f"git commit -m '{new_msg}'", cmd)
-        correction = commit_msg_pattern.sub(f"git commit -m '{new_msg}'", correction)
+        cmd = COMMIT_MSG_PATTERN.sub(f"git commit -m '{new_msg}'", cmd)
+        correction = COMMIT_MSG_PATTERN.sub(f"git commit -m '{new_msg}'", correction)
 
     # ---- "command not found" gibberish — replace the unknown command token ----
-    cnf_pattern = re.compile(r"^(\S+): command not found", re.MULTILINE)
-    if cnf_pattern.search(stderr) and correction == "?":
-        old_token = cnf_pattern.search(stderr).group(1)
-        # Only replace if it's clearly gibberish (not a real tool name we care about)
-        known_typos = {
-            "gti", "sl", "pytohn", "ndoe", "dcoker", "kubeclt",
-            "teh", "grpe", "maek", "carog", "dc",
-        }
-        if old_token in GIBBERISH_CMDS or old_token not in known_typos:
-            new_token = rng.choice(GIBBERISH_CMDS)
-            # Replace in cmd too if it matches
-            if cmd.startswith(old_token):
-                cmd = cmd.replace(old_token, new_token, 1)
-            stderr = stderr.replace(old_token, new_token)
+    if found.cnf_token:
+        old_token = found.cnf_token
+        new_token = rng.choice(GIBBERISH_CMDS)
+        # Replace in cmd too if it matches
+        if cmd.startswith(old_token):
+            cmd = cmd.replace(old_token, new_token, 1)
+        stderr = stderr.replace(old_token, new_token)
 
     # ---- trailing slash variation on dir-style args ----
     if rng.random() < 0.25:
         # Randomly add trailing slash to bare dir names in commands
-        cmd = re.sub(r"\b(src|dist|build|lib|bin|tmp)\b(?!/)",
-                     lambda m: m.group(0) + "/" if rng.random() < 0.5 else m.group(0),
-                     cmd)
+        cmd = TRAILING_SLASH_PATTERN.sub(
+            lambda m: m.group(0) + "/" if rng.random() < 0.5 else m.group(0),
+            cmd,
+        )
 
     return {
         "command": cmd,
@@ -537,14 +640,38 @@ def augment_example(example: dict, rng: random.Random) -> dict:
     }
 
 
+def _dedup_key(example: dict) -> bytes:
+    """Return a compact 128-bit key identifying an example's contents."""
+    text = "\x00".join((example["command"], example["stderr"], example["correction"]))
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+# Examples per worker task on the fixed --n-variations path. Fixed rather than
+# derived from the worker count so output doesn't depend on -j.
+CHUNK_SIZE = 16
+
+
+def _augment_chunk(examples: list[dict], n_variations: int, seed: int) -> list[dict]:
+    """Generate n_variations of each example using a dedicated RNG.
+
+    Top-level so it can run in a worker process.
+    """
+    rng = random.Random(seed)
+    return [augment_example(ex, rng) for ex in examples for _ in range(n_variations)]
+
+
 def augment_dataset(
     examples: list[dict],
     n_variations: int,
     seed: int,
     target_count: int | None = None,
-) -> list[dict]:
+    workers: int = 1,
+) -> Iterator[dict]:
     """Augment a dataset by generating variations of each example.
 
+    Examples are yielded as they are accepted so callers can stream them to
+    disk; only the 16-byte dedup keys are kept in memory.
+
     Args:
         examples: Base examples to augment.
         n_variations: Number of variations to generate per example (used when
@@ -552,60 +679,77 @@ def augment_dataset(
         seed: Random seed for reproducibility.
         target_count: If set, keep generating until we have at least this many
                       unique examples (after dedup).
+        workers: Number of worker processes. Each task gets its own seed drawn
+                 from the main RNG, so output is the same for any worker count.
 
-    Returns:
-        List of all examples (originals + augmented), deduplicated.
+    Yields:
+        All examples (originals + augmented), deduplicated.
     """
     rng = random.Random(seed)
 
-    # Shuffle all wordlist-backed pools for this run
-    for pool in [PACKAGES, DOCKER_IMAGES, K8S_RESOURCES, REPO_NAMES,
-                 GITHUB_USERS, SYSTEM_PACKAGES]:
-        rng.shuffle(pool)
-
     # Always include originals
-    seen: set[str] = set()
-    unique: list[dict] = []
+    seen: set[bytes] = set()
 
     def add(ex: dict) -> bool:
-        key = json.dumps(ex, sort_keys=True)
+        key = _dedup_key(ex)
         if key not in seen:
             seen.add(key)
-            unique.append(ex)
             return True
         return False
 
     for ex in examples:
-        add(ex)
-
-    if target_count is not None:
-        # Keep cycling through examples and augmenting until we hit the target.
-        # Stall detection: if we go a full pass without adding anything new, give up.
-        stall_passes = 0
-        max_stall_passes = 10
-        while len(unique) < target_count and stall_passes < max_stall_passes:
-            added_this_pass = 0
-            rng.shuffle(examples)
-            for ex in examples:
-                if len(unique) >= target_count:
-                    break
-                varied = augment_example(ex, rng)
-                if add(varied):
-                    added_this_pass += 1
-            if added_this_pass == 0:
-                stall_passes += 1
-            else:
-                stall_passes = 0
-        if len(unique) < target_count:
-            print(f"  (stalled at {len(unique):,} after {max_stall_passes} empty passes)")
-        return unique
-    else:
-        # Fixed n_variations per example
-        for example in examples:
-            for _ in range(n_variations):
-                varied = augment_example(example, rng)
-                add(varied)
-        return unique
+        if add(ex):
+            yield ex
+
+    # Examples with nothing to vary would only ever reproduce themselves.
+    examples = [
+        ex for ex in examples
+        if _analyze(ex["command"], ex["stderr"], ex["correction"]).can_vary()
+    ]
+
+    with ProcessPoolExecutor(workers) if workers > 1 else nullcontext() as executor:
+        run = executor.map if executor else map
+
+        if target_count is not None:
+            # Keep cycling through examples and augmenting until we hit the target.
+            # Stall detection: if we go a full pass without adding anything new, give up.
+            # Each pass is one task; a round queues enough passes to keep every
+            # worker busy and results are consumed in pass order.
+            stall_passes = 0
+            max_stall_passes = 10
+            passes_per_round = max(1, 2 * workers)
+            while examples and len(seen) < target_count and stall_passes < max_stall_passes:
+                passes, seeds = [], []
+                for _ in range(passes_per_round):
+                    rng.shuffle(examples)
+                    passes.append(list(examples))
+                    seeds.append(rng.getrandbits(64))
+                for variations in run(_augment_chunk, passes, repeat(1), seeds):
+                    added_this_pass = 0
+                    for varied in variations:
+                        if len(seen) >= target_count:
+                            break
+                        if add(varied):
+                            added_this_pass += 1
+                            yield varied
+                    if added_this_pass == 0:
+                        stall_passes += 1
+                    else:
+                        stall_passes = 0
+                    if len(seen) >= target_count or stall_passes >= max_stall_passes:
+                        break
+            if not examples:
+                print(f"  (stopped at {len(seen):,}: no example has anything to vary)")
+            elif len(seen) < target_count:
+                print(f"  (stalled at {len(seen):,} after {max_stall_passes} empty passes)")
+        else:
+            # Fixed n_variations per example
+            chunks = [examples[i:i + CHUNK_SIZE] for i in range(0, len(examples), CHUNK_SIZE)]
+            seeds = [rng.getrandbits(64) for _ in chunks]
+            for variations in run(_augment_chunk, chunks, repeat(n_variations), seeds):
+                for varied in variations:
+                    if add(varied):
+                        yield varied
 
 
 def main():
@@ -645,7 +789,20 @@ def main():
         default=42,
         help="Random seed for reproducibility (default: 42)",
     )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Worker processes; output does not depend on this. Process startup "
+            "outweighs the work at the default sizes, so only raise it for much "
+            "larger inputs (default: 1)"
+        ),
+    )
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     if not args.input.exists():
         print(f"Error: input file {args.input} not found")
@@ -667,27 +824,28 @@ def main():
     else:
         print(f"Generating {args.n_variations} variations per example…")
 
-    # Augment (dedup is now done inside augment_dataset)
-    unique = augment_dataset(
-        examples,
-        n_variations=args.n_variations,
-        seed=args.seed,
-        target_count=args.target_count,
-    )
-
-    # Write output
+    # Augment and write as we go (dedup is done inside augment_dataset)
     args.output.parent.mkdir(parents=True, exist_ok=True)
+    n_positive = n_negative = 0
     with open(args.output, "w") as f:
-        for ex in unique:
+        for ex in augment_dataset(
+            examples,
+            n_variations=args.n_variations,
+            seed=args.seed,
+            target_count=args.target_count,
+            workers=args.workers,
+        ):
             f.write(json.dumps(ex) + "\n")
+            if ex["correction"] == "?":
+                n_negative += 1
+            else:
+                n_positive += 1
 
-    n_positive = sum(1 for ex in unique if ex["correction"] != "?")
-    n_negative = sum(1 for ex in unique if ex["correction"] == "?")
-
-    print(f"Generated {len(unique):,} unique examples")
+    n_total = n_positive + n_negative
+    print(f"Generated {n_total:,} unique examples")
     print(f"  Positive: {n_positive:,}")
     print(f"  Negative: {n_negative:,}")
-    print(f"  Negative ratio: {n_negative / len(unique):.1%}")
+    print(f"  Negative ratio: {n_negative / n_total:.1%}")
     print(f"Written to {args.output}")
 
 
@@ -12,9 +12,18 @@ import argparse
 import shutil
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+# Quantizations convert_hf_to_gguf.py can write itself (its --outtype), which
+# lets the export skip the intermediate file and llama-quantize entirely
+CONVERTER_QUANT_TYPES = {"q8_0"}
 
+# Lines of relayed tool output between flushes; progress redraws flush at once
+RELAY_FLUSH_LINES = 50
+
+
+@lru_cache(maxsize=None)
 def find_llama_cpp_convert_script() -> Path | None:
     """Try to find the llama.cpp convert-hf-to-gguf.py script.
 
@@ -22,6 +31,8 @@ def find_llama_cpp_convert_script() -> Path | None:
     1. In the llama-cpp-python package vendor directory
     2. In a local llama.cpp clone
     3. On PATH
+
+    The result is cached, so repeated lookups don't re-walk PATH.
     """
     # Check if llama-cpp-python has bundled scripts
     try:
@@ -55,8 +66,9 @@ def find_llama_cpp_convert_script() -> Path | None:
     return None
 
 
+@lru_cache(maxsize=None)
 def find_quantize_binary() -> Path | None:
-    """Find the llama-quantize (or llama.cpp quantize) binary."""
+    """Find the llama-quantize (or llama.cpp quantize) binary (cached)."""
     # Check PATH first
     for name in ["llama-quantize", "quantize"]:
         which = shutil.which(name)
@@ -75,8 +87,38 @@ def find_quantize_binary() -> Path | None:
     return None
 
 
-def convert_to_gguf(model_dir: Path, output_path: Path) -> bool:
-    """Convert a HuggingFace model to GGUF F16 format.
+def run_streaming(cmd: list[str]) -> bool:
+    """Run a command, showing its combined output as it runs.
+
+    On a terminal the child writes to it directly, so its progress output
+    stays unbuffered. When stdout is redirected to a log file, Python would
+    block-buffer this script's own prints, so the output is instead relayed
+    through our stdout as raw bytes to keep it in order with them. Raw bytes
+    keep tqdm's carriage-return redraws on one line and can't raise on
+    non-UTF-8 output; they are flushed on every redraw and otherwise every
+    RELAY_FLUSH_LINES lines.
+
+    Returns True on success.
+    """
+    print(f"Running: {' '.join(cmd)}", flush=True)
+    if sys.stdout.isatty():
+        return subprocess.run(cmd, stderr=subprocess.STDOUT).returncode == 0
+
+    out = sys.stdout.buffer
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as proc:
+        pending_lines = 0
+        while chunk := proc.stdout.read1(65536):
+            out.write(chunk)
+            pending_lines += chunk.count(b"\n")
+            if b"\r" in chunk or pending_lines >= RELAY_FLUSH_LINES:
+                out.flush()
+                pending_lines = 0
+        out.flush()
+    return proc.returncode == 0
+
+
+def convert_to_gguf(model_dir: Path, output_path: Path, outtype: str = "bf16") -> bool:
+    """Convert a HuggingFace model to GGUF (bf16 by default).
 
     Returns True on success.
     """
@@ -100,12 +142,20 @@ def convert_to_gguf(model_dir: Path, output_path: Path) -> bool:
         "--outfile",
         str(output_path),
         "--outtype",
-        "f16",
+        outtype,
     ]
 
-    print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=False)
-    return result.returncode == 0
+    return run_streaming(cmd)
+
+
+def print_missing_quantize_help():
+    print("Error: Could not find llama-quantize binary")
+    print()
+    print("Please build llama.cpp:")
+    print("  git clone https://github.com/ggml-org/llama.cpp")
+    print("  cd llama.cpp && cmake -B build && cmake --build build")
+    print()
+    print("Then re-run this script.")
 
 
 def quantize_gguf(
@@ -117,13 +167,7 @@ def quantize_gguf(
     """
     quantize_bin = find_quantize_binary()
     if quantize_bin is None:
-        print("Error: Could not find llama-quantize binary")
-        print()
-        print("Please build llama.cpp:")
-        print("  git clone https://github.com/ggml-org/llama.cpp")
-        print("  cd llama.cpp && cmake -B build && cmake --build build")
-        print()
-        print("Then re-run this script.")
+        print_missing_quantize_help()
         return False
 
     print(f"Using quantize binary: {quantize_bin}")
@@ -135,9 +179,7 @@ def quantize_gguf(
         quant_type,
     ]
 
-    print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=False)
-    return result.returncode == 0
+    return run_streaming(cmd)
 
 
 def main():
@@ -164,10 +206,17 @@ def main():
         default="Q4_K_M",
         help="Quantization type (default: Q4_K_M)",
     )
+    parser.add_argument(
+        "--outtype",
+        choices=["bf16", "f16"],
+        default="bf16",
+        help="Type of the intermediate GGUF before quantization (default: bf16). "
+        "Avoid f16 for Gemma: its weights overflow IEEE float16.",
+    )
     parser.add_argument(
         "--keep-f16",
         action="store_true",
-        help="Keep the intermediate F16 GGUF file",
+        help="Keep the intermediate (unquantized) GGUF file",
     )
     args = parser.parse_args()
 
@@ -179,36 +228,55 @@ def main():
     # Ensure output directory exists
     args.output.parent.mkdir(parents=True, exist_ok=True)
 
-    # Step 1: Convert HF model to GGUF F16
-    f16_path = args.output.with_suffix(".f16.gguf")
-    print(f"Step 1: Converting HF model to GGUF F16...")
+    # The converter can emit some quantizations itself; then there's no
+    # intermediate file and no separate quantize step.
+    if args.quant_type.lower() in CONVERTER_QUANT_TYPES:
+        print(f"Converting HF model directly to GGUF {args.quant_type}...")
+        print(f"  Input:  {args.model_dir}")
+        print(f"  Output: {args.output}")
+        if not convert_to_gguf(args.model_dir, args.output, args.quant_type.lower()):
+            print("\nConversion to GGUF failed.")
+            raise SystemExit(1)
+        final_size = args.output.stat().st_size / (1024 * 1024)
+        print(f"\n{args.quant_type} GGUF size: {final_size:.1f} MB")
+        print(f"\nExport complete: {args.output}")
+        return
+
+    # Fail now rather than after a slow conversion if the quantizer is missing
+    if find_quantize_binary() is None:
+        print_missing_quantize_help()
+        raise SystemExit(1)
+
+    # Step 1: Convert HF model to an unquantized GGUF
+    intermediate_path = args.output.with_suffix(f".{args.outtype}.gguf")
+    print(f"Step 1: Converting HF model to GGUF {args.outtype.upper()}...")
     print(f"  Input:  {args.model_dir}")
-    print(f"  Output: {f16_path}")
+    print(f"  Output: {intermediate_path}")
 
-    if not convert_to_gguf(args.model_dir, f16_path):
+    if not convert_to_gguf(args.model_dir, intermediate_path, args.outtype):
         print("\nConversion to GGUF failed.")
         raise SystemExit(1)
 
-    f16_size = f16_path.stat().st_size / (1024 * 1024)
-    print(f"\nF16 GGUF size: {f16_size:.1f} MB")
+    intermediate_size = intermediate_path.stat().st_size / (1024 * 1024)
+    print(f"\n{args.outtype.upper()} GGUF size: {intermediate_size:.1f} MB")
 
     # Step 2: Quantize to target type
     print(f"\nStep 2: Quantizing to {args.quant_type}...")
-    print(f"  Input:  {f16_path}")
+    print(f"  Input:  {intermediate_path}")
     print(f"  Output: {args.output}")
 
-    if not quantize_gguf(f16_path, args.output, args.quant_type):
+    if not quantize_gguf(intermediate_path, args.output, args.quant_type):
         print("\nQuantization failed.")
         raise SystemExit(1)
 
     final_size = args.output.stat().st_size / (1024 * 1024)
     print(f"\n{args.quant_type} GGUF size: {final_size:.1f} MB")
-    print(f"Compression ratio: {f16_size / final_size:.1f}x")
+    print(f"Compression ratio: {intermediate_size / final_size:.1f}x")
 
-    # Clean up F16 intermediate file
+    # Clean up the intermediate file
     if not args.keep_f16:
-        f16_path.unlink()
-        print(f"Removed intermediate F16 file: {f16_path}")
+        intermediate_path.unlink()
+        print(f"Removed intermediate {args.outtype.upper()} file: {intermediate_path}")
 
     print(f"\nExport complete: {args.output}")
 
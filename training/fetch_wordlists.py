@@ -5,19 +5,31 @@ Pulls top packages from PyPI, npm, crates.io and generates realistic
 docker image names, repo names, etc. Writes one name per line to
 training/wordlists/*.txt files.
 
+API responses are cached in ~/.cache/shit-training/http/ and revalidated
+with ETag/Last-Modified, so re-runs mostly get cheap 304s.
+
 Usage:
-    python3 fetch_wordlists.py
+    python3 fetch_wordlists.py [--offline]
 """
 
+import argparse
+import hashlib
 import json
+import os
+import re
+import urllib.error
 import urllib.request
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 WORDLISTS_DIR = Path(__file__).parent / "wordlists"
+CACHE_DIR = Path.home() / ".cache" / "shit-training" / "http"
 
 # Commands that should NEVER appear in placeholder lists — these are
 # "functional" tokens the model needs to treat as actual commands
-BLOCKED_NAMES = {
+BLOCKED_NAMES = frozenset({
     "python", "python3", "pip", "pip3", "node", "npm", "npx",
     "cargo", "rustc", "go", "java", "javac", "ruby", "gem",
     "git", "docker", "kubectl", "terraform", "ansible",
@@ -30,59 +42,107 @@ BLOCKED_NAMES = {
     "vim", "nvim", "nano", "emacs", "code",
     "bash", "zsh", "fish", "sh",
     "test", "true", "false", "echo", "printf",
-}
-
-
-def fetch_json(url: str) -> dict | list:
-    """Fetch JSON from a URL."""
-    req = urllib.request.Request(url, headers={"User-Agent": "shit-training/1.0"})
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        return json.loads(resp.read())
-
-
-def filter_names(names: list[str]) -> list[str]:
-    """Remove blocked names and duplicates, keep only clean identifiers."""
+})
+
+# Clean identifiers only: 2-40 chars of [a-z0-9._-], starting alphanumeric.
+# Too-short names are likely to collide; weird characters break commands.
+NAME_PATTERN = re.compile(r"[a-z0-9][a-z0-9._-]{1,39}")
+
+
+def write_atomic(path: Path, data: bytes):
+    """Write via a temp file and rename, so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def fetch_json(url: str, offline: bool = False) -> dict | list:
+    """Fetch JSON from a URL, revalidating against the on-disk cache.
+
+    With offline=True the network is never touched and an uncached URL is an
+    error (which the fetchers turn into their fallback path).
+    """
+    key = hashlib.sha256(url.encode()).hexdigest()
+    body_path = CACHE_DIR / f"{key}.json"
+    meta_path = CACHE_DIR / f"{key}.meta.json"
+    if offline:
+        if not body_path.exists():
+            raise FileNotFoundError(f"{url} is not cached (--offline)")
+        return json.loads(body_path.read_bytes())
+
+    headers = {"User-Agent": "shit-training/1.0"}
+    if body_path.exists() and meta_path.exists():
+        meta = json.loads(meta_path.read_bytes())
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            body = resp.read()
+            meta = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            }
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise
+        # Not modified: the cached copy is current
+        return json.loads(body_path.read_bytes())
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    write_atomic(body_path, body)
+    write_atomic(meta_path, json.dumps(meta).encode())
+    return json.loads(body)
+
+
+def filter_names(names: Iterable[str]) -> list[str]:
+    """Remove blocked names and duplicates, keep only clean identifiers.
+
+    Takes any iterable so fetchers can stream names straight from the parsed
+    responses without collecting them into a list first.
+    """
     seen = set()
     result = []
     for name in names:
         name = name.strip().lower()
-        if not name or name in BLOCKED_NAMES or name in seen:
-            continue
-        # Skip names that are too short (likely to collide) or too long
-        if len(name) < 2 or len(name) > 40:
-            continue
-        # Skip names with weird characters
-        if not all(c.isalnum() or c in "-_." for c in name):
+        # Cheapest, most common rejection first; the pattern also rules out
+        # empty names
+        if not NAME_PATTERN.fullmatch(name) or name in BLOCKED_NAMES or name in seen:
             continue
         seen.add(name)
         result.append(name)
     return result
 
 
-def write_wordlist(name: str, entries: list[str]):
+def write_wordlist(name: str, entries: Iterable[str]):
     """Write a wordlist file (one entry per line, sorted)."""
     path = WORDLISTS_DIR / f"{name}.txt"
     # Sort for deterministic diffs in git
     entries = sorted(set(entries))
-    path.write_text("\n".join(entries) + "\n")
+    # Atomic so an interrupted run never leaves a truncated wordlist behind
+    write_atomic(path, ("\n".join(entries) + "\n").encode())
     print(f"  {name}.txt: {len(entries)} entries")
 
 
-def fetch_pypi_top() -> list[str]:
-    """Fetch top PyPI packages from hugovk's top-pypi-packages dataset."""
+def fetch_pypi_top(offline: bool = False) -> list[str]:
+    """Fetch top PyPI packages from hugovk's top-pypi-packages dataset (filtered)."""
     print("Fetching top PyPI packages...")
     try:
-        data = fetch_json("https://hugovk.github.io/top-pypi-packages/top-pypi-packages-30-days.min.json")
-        return [row["project"] for row in data["rows"][:800]]
+        data = fetch_json(
+            "https://hugovk.github.io/top-pypi-packages/top-pypi-packages-30-days.min.json",
+            offline,
+        )
+        return filter_names(row["project"] for row in data["rows"][:800])
     except Exception as e:
         print(f"  Warning: PyPI fetch failed ({e}), using fallback")
         return []
 
 
-def fetch_npm_top() -> list[str]:
-    """Fetch popular npm packages from the registry."""
+def fetch_npm_top(offline: bool = False) -> list[str]:
+    """Fetch popular npm packages from the registry (filtered)."""
     print("Fetching popular npm packages...")
-    names = []
     try:
         # Search across several keyword categories to get diverse results
         keywords = [
@@ -90,222 +150,255 @@ def fetch_npm_top() -> list[str]:
             "keywords:node", "keywords:cli", "keywords:utility",
             "keywords:server", "keywords:database", "keywords:testing",
         ]
-        for kw in keywords:
-            for offset in range(0, 250, 250):
-                url = f"https://registry.npmjs.org/-/v1/search?text={kw}&size=250&from={offset}"
-                data = fetch_json(url)
-                for obj in data.get("objects", []):
-                    name = obj.get("package", {}).get("name", "")
-                    # Skip scoped packages (@org/pkg) — they cause issues in command contexts
-                    if name and not name.startswith("@"):
-                        names.append(name)
-        return names
+        urls = [
+            f"https://registry.npmjs.org/-/v1/search?text={kw}&size=250&from={offset}"
+            for kw in keywords
+            for offset in range(0, 250, 250)
+        ]
+        # The queries are independent, so issue them all at once
+        # Scoped packages (@org/pkg) cause issues in command contexts; the
+        # name filter rejects them along with everything else unusable
+        with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+            return filter_names(
+                obj.get("package", {}).get("name", "")
+                for data in pool.map(partial(fetch_json, offline=offline), urls)
+                for obj in data.get("objects", [])
+            )
     except Exception as e:
         print(f"  Warning: npm fetch failed ({e}), using fallback")
         return []
 
 
-def fetch_crates_top() -> list[str]:
-    """Fetch top crates from crates.io."""
+def fetch_crates_top(offline: bool = False) -> list[str]:
+    """Fetch top crates from crates.io (filtered)."""
     print("Fetching top crates...")
-    names = []
     try:
-        for page in range(1, 6):
-            url = f"https://crates.io/api/v1/crates?page={page}&per_page=100&sort=downloads"
-            data = fetch_json(url)
-            for crate in data.get("crates", []):
-                names.append(crate["id"])
-        return names
+        pages = (
+            fetch_json(
+                f"https://crates.io/api/v1/crates?page={page}&per_page=100&sort=downloads",
+                offline,
+            )
+            for page in range(1, 6)
+        )
+        return filter_names(crate["id"] for data in pages for crate in data.get("crates", []))
     except Exception as e:
         print(f"  Warning: crates.io fetch failed ({e}), using fallback")
         return []
 
 
-def generate_docker_images() -> list[str]:
+# Real official images
+DOCKER_OFFICIAL_IMAGES = (
+    "nginx", "postgres", "redis", "mysql", "mariadb", "mongo",
+    "memcached", "rabbitmq", "elasticsearch", "kibana", "logstash",
+    "grafana/grafana", "prom/prometheus", "traefik", "caddy",
+    "vault", "consul", "minio", "keycloak", "gitlab/gitlab-ce",
+    "jenkins/jenkins", "sonarqube", "nexus3", "registry",
+    "httpd", "haproxy", "envoy", "linkerd2-proxy",
+    "influxdb", "clickhouse", "cassandra", "couchdb", "neo4j",
+    "wordpress", "ghost", "drupal", "joomla", "mediawiki",
+    "nextcloud", "gitea", "drone/drone", "argo", "airflow",
+    "superset", "metabase", "redash", "jupyter/base-notebook",
+    "tensorflow/tensorflow", "pytorch/pytorch",
+)
+
+# Realistic app-style names (the kind people actually use)
+DOCKER_APP_IMAGES = (
+    "auth-service", "api-gateway", "user-service", "payment-service",
+    "notification-service", "order-service", "inventory-service",
+    "search-service", "chat-service", "email-service",
+    "frontend-app", "admin-panel", "dashboard-ui", "landing-page",
+    "worker-processor", "queue-consumer", "event-handler",
+    "data-pipeline", "etl-runner", "cron-scheduler",
+    "billing-api", "analytics-service", "recommendation-engine",
+    "file-uploader", "image-resizer", "pdf-generator",
+    "health-checker", "load-balancer", "rate-limiter",
+    "cache-warmer", "session-store", "config-server",
+    "log-aggregator", "metrics-collector", "trace-exporter",
+    "deploy-bot", "ci-runner", "test-harness",
+    "proxy-server", "websocket-gateway", "grpc-server",
+    "task-scheduler", "job-runner", "batch-processor",
+    "content-api", "media-service", "asset-manager",
+)
+
+
+def generate_docker_images() -> tuple[str, ...]:
     """Generate realistic docker image names (no myapp!)."""
-    # Real official images
-    official = [
-        "nginx", "postgres", "redis", "mysql", "mariadb", "mongo",
-        "memcached", "rabbitmq", "elasticsearch", "kibana", "logstash",
-        "grafana/grafana", "prom/prometheus", "traefik", "caddy",
-        "vault", "consul", "minio", "keycloak", "gitlab/gitlab-ce",
-        "jenkins/jenkins", "sonarqube", "nexus3", "registry",
-        "httpd", "haproxy", "envoy", "linkerd2-proxy",
-        "influxdb", "clickhouse", "cassandra", "couchdb", "neo4j",
-        "wordpress", "ghost", "drupal", "joomla", "mediawiki",
-        "nextcloud", "gitea", "drone/drone", "argo", "airflow",
-        "superset", "metabase", "redash", "jupyter/base-notebook",
-        "tensorflow/tensorflow", "pytorch/pytorch",
-    ]
-    # Realistic app-style names (the kind people actually use)
-    app_names = [
-        "auth-service", "api-gateway", "user-service", "payment-service",
-        "notification-service", "order-service", "inventory-service",
-        "search-service", "chat-service", "email-service",
-        "frontend-app", "admin-panel", "dashboard-ui", "landing-page",
-        "worker-processor", "queue-consumer", "event-handler",
-        "data-pipeline", "etl-runner", "cron-scheduler",
-        "billing-api", "analytics-service", "recommendation-engine",
-        "file-uploader", "image-resizer", "pdf-generator",
-        "health-checker", "load-balancer", "rate-limiter",
-        "cache-warmer", "session-store", "config-server",
-        "log-aggregator", "metrics-collector", "trace-exporter",
-        "deploy-bot", "ci-runner", "test-harness",
-        "proxy-server", "websocket-gateway", "grpc-server",
-        "task-scheduler", "job-runner", "batch-processor",
-        "content-api", "media-service", "asset-manager",
-    ]
-    return official + app_names
-
-
-def generate_repo_names() -> list[str]:
+    return DOCKER_OFFICIAL_IMAGES + DOCKER_APP_IMAGES
+
+
+REPO_NAMES = (
+    # Product-style
+    "acme-api", "acme-web", "acme-mobile", "acme-cli",
+    "dashboard", "portal", "console", "platform",
+    "marketplace", "storefront", "checkout", "cart",
+    # Service-style
+    "auth-service", "user-api", "billing-api", "payment-gateway",
+    "notification-hub", "event-bus", "message-queue",
+    "search-engine", "recommendation-api", "analytics-api",
+    "file-service", "media-api", "content-api",
+    # Infrastructure
+    "infra", "terraform-modules", "k8s-configs", "helm-charts",
+    "docker-images", "ci-pipelines", "deploy-scripts",
+    "monitoring-stack", "logging-stack", "tracing-stack",
+    # Libraries/tools
+    "common-lib", "shared-utils", "core-sdk", "client-sdk",
+    "data-models", "proto-definitions", "api-contracts",
+    "lint-rules", "test-fixtures", "dev-tools",
+    # Project naming patterns
+    "phoenix", "atlas", "nova", "pulse", "forge",
+    "beacon", "compass", "horizon", "nexus", "orbit",
+    "prism", "relay", "sentinel", "shuttle", "spark",
+    "summit", "titan", "vapor", "vertex", "zenith",
+    "aurora", "cascade", "dynamo", "echo", "flux",
+    "genesis", "hive", "iris", "jade", "kite",
+    "lunar", "mesa", "oasis", "pinnacle", "quartz",
+    "ripple", "sierra", "tundra", "unity", "vortex",
+    # Language-specific project patterns
+    "fastapi-template", "express-starter", "rails-app",
+    "spring-boot-api", "flask-backend", "django-project",
+    "next-app", "nuxt-app", "svelte-kit", "remix-app",
+    "actix-web-api", "axum-service", "gin-api", "fiber-app",
+    # Monorepo / workspace
+    "monorepo", "workspace", "packages", "apps",
+    "frontend", "backend", "services", "tools",
+    # OSS project vibes
+    "rustlings", "exercism", "leetcode-solutions",
+    "dotfiles", "config", "setup", "bootstrap",
+)
+
+
+def generate_repo_names() -> tuple[str, ...]:
     """Generate realistic repository names."""
-    return [
-        # Product-style
-        "acme-api", "acme-web", "acme-mobile", "acme-cli",
-        "dashboard", "portal", "console", "platform",
-        "marketplace", "storefront", "checkout", "cart",
-        # Service-style
-        "auth-service", "user-api", "billing-api", "payment-gateway",
-        "notification-hub", "event-bus", "message-queue",
-        "search-engine", "recommendation-api", "analytics-api",
-        "file-service", "media-api", "content-api",
-        # Infrastructure
-        "infra", "terraform-modules", "k8s-configs", "helm-charts",
-        "docker-images", "ci-pipelines", "deploy-scripts",
-        "monitoring-stack", "logging-stack", "tracing-stack",
-        # Libraries/tools
-        "common-lib", "shared-utils", "core-sdk", "client-sdk",
-        "data-models", "proto-definitions", "api-contracts",
-        "lint-rules", "test-fixtures", "dev-tools",
-        # Project naming patterns
-        "phoenix", "atlas", "nova", "pulse", "forge",
-        "beacon", "compass", "horizon", "nexus", "orbit",
-        "prism", "relay", "sentinel", "shuttle", "spark",
-        "summit", "titan", "vapor", "vertex", "zenith",
-        "aurora", "cascade", "dynamo", "echo", "flux",
-        "genesis", "hive", "iris", "jade", "kite",
-        "lunar", "mesa", "oasis", "pinnacle", "quartz",
-        "ripple", "sierra", "tundra", "unity", "vortex",
-        # Language-specific project patterns
-        "fastapi-template", "express-starter", "rails-app",
-        "spring-boot-api", "flask-backend", "django-project",
-        "next-app", "nuxt-app", "svelte-kit", "remix-app",
-        "actix-web-api", "axum-service", "gin-api", "fiber-app",
-        # Monorepo / workspace
-        "monorepo", "workspace", "packages", "apps",
-        "frontend", "backend", "services", "tools",
-        # OSS project vibes
-        "rustlings", "exercism", "leetcode-solutions",
-        "dotfiles", "config", "setup", "bootstrap",
-    ]
-
-
-def generate_github_users() -> list[str]:
+    return REPO_NAMES
+
+
+GITHUB_USERS = (
+    # Personal-style
+    "jsmith", "akim", "mchen", "patel", "garcia", "mueller",
+    "tanaka", "silva", "wang", "johnson", "williams", "brown",
+    "jones", "davis", "miller", "wilson", "moore", "taylor",
+    "dev-alex", "code-sam", "hack-max", "byte-lee",
+    # Org-style
+    "acme-corp", "bigtech-inc", "startup-labs", "open-source-co",
+    "cloud-systems", "data-team", "infra-ops", "platform-eng",
+    "dev-tools-inc", "api-co", "web-studio", "mobile-labs",
+    "ml-research", "security-team", "devops-crew", "sre-team",
+    # Community/project orgs
+    "rust-lang", "golang", "nodejs", "python", "dotnet",
+    "apache", "eclipse", "mozilla", "linux", "kubernetes",
+    "hashicorp", "elastic", "grafana", "prometheus",
+    "vercel", "netlify", "supabase", "prisma", "turbo",
+    "tailwindlabs", "shadcn", "radix-ui", "headlessui",
+)
+
+
+def generate_github_users() -> tuple[str, ...]:
     """Generate realistic GitHub usernames and org names."""
-    return [
-        # Personal-style
-        "jsmith", "akim", "mchen", "patel", "garcia", "mueller",
-        "tanaka", "silva", "wang", "johnson", "williams", "brown",
-        "jones", "davis", "miller", "wilson", "moore", "taylor",
-        "dev-alex", "code-sam", "hack-max", "byte-lee",
-        # Org-style
-        "acme-corp", "bigtech-inc", "startup-labs", "open-source-co",
-        "cloud-systems", "data-team", "infra-ops", "platform-eng",
-        "dev-tools-inc", "api-co", "web-studio", "mobile-labs",
-        "ml-research", "security-team", "devops-crew", "sre-team",
-        # Community/project orgs
-        "rust-lang", "golang", "nodejs", "python", "dotnet",
-        "apache", "eclipse", "mozilla", "linux", "kubernetes",
-        "hashicorp", "elastic", "grafana", "prometheus",
-        "vercel", "netlify", "supabase", "prisma", "turbo",
-        "tailwindlabs", "shadcn", "radix-ui", "headlessui",
-    ]
-
-
-def generate_k8s_resources() -> list[str]:
+    return GITHUB_USERS
+
+
+K8S_RESOURCES = (
+    # Services
+    "auth-service", "user-service", "order-service",
+    "payment-service", "notification-service", "search-service",
+    "gateway", "api-gateway", "ingress-nginx",
+    # Deployments
+    "frontend", "backend", "worker", "scheduler", "cron",
+    "web-app", "admin-app", "api-server", "grpc-server",
+    # Databases
+    "postgres", "redis", "mongo", "elasticsearch",
+    "mysql", "cassandra", "rabbitmq", "kafka",
+    # Infra
+    "prometheus", "grafana", "jaeger", "fluentd",
+    "cert-manager", "external-dns", "vault",
+    "istio-proxy", "envoy-sidecar", "linkerd",
+    # Jobs
+    "db-migration", "data-sync", "backup-job",
+    "cleanup-cron", "report-generator", "index-rebuild",
+)
+
+
+def generate_k8s_resources() -> tuple[str, ...]:
     """Generate realistic Kubernetes resource names."""
-    return [
-        # Services
-        "auth-service", "user-service", "order-service",
-        "payment-service", "notification-service", "search-service",
-        "gateway", "api-gateway", "ingress-nginx",
-        # Deployments
-        "frontend", "backend", "worker", "scheduler", "cron",
-        "web-app", "admin-app", "api-server", "grpc-server",
-        # Databases
-        "postgres", "redis", "mongo", "elasticsearch",
-        "mysql", "cassandra", "rabbitmq", "kafka",
-        # Infra
-        "prometheus", "grafana", "jaeger", "fluentd",
-        "cert-manager", "external-dns", "vault",
-        "istio-proxy", "envoy-sidecar", "linkerd",
-        # Jobs
-        "db-migration", "data-sync", "backup-job",
-        "cleanup-cron", "report-generator", "index-rebuild",
-    ]
-
-
-def generate_system_packages() -> list[str]:
+    return K8S_RESOURCES
+
+
+SYSTEM_PACKAGES = (
+    # Core tools
+    "vim", "neovim", "nano", "emacs",
+    "git", "git-lfs", "tig", "lazygit",
+    "curl", "wget", "aria2", "httpie",
+    "htop", "btop", "glances", "nmon",
+    "tmux", "screen", "byobu", "zellij",
+    "zsh", "fish", "starship", "oh-my-zsh",
+    # Dev tools
+    "build-essential", "gcc", "g++", "clang", "llvm",
+    "cmake", "meson", "ninja-build", "autoconf", "automake",
+    "gdb", "lldb", "valgrind", "strace", "ltrace",
+    "python3", "python3-pip", "python3-venv", "python3-dev",
+    "nodejs", "npm", "yarn",
+    "rustup", "golang", "openjdk-17-jdk",
+    # Networking
+    "openssh-server", "openssh-client", "mosh",
+    "nmap", "netcat", "socat", "tcpdump", "wireshark",
+    "iptables", "nftables", "ufw", "firewalld",
+    "dnsutils", "bind-utils", "dig", "nslookup",
+    "iproute2", "net-tools", "traceroute", "mtr",
+    # System
+    "systemd", "cron", "logrotate", "rsyslog",
+    "lsof", "procps", "psmisc", "sysstat",
+    "e2fsprogs", "xfsprogs", "btrfs-progs", "lvm2",
+    "smartmontools", "hdparm", "nvme-cli",
+    # Modern CLI tools
+    "ripgrep", "fd-find", "bat", "exa", "eza",
+    "fzf", "delta", "dust", "duf", "procs",
+    "sd", "choose", "jq", "yq", "xsv",
+    "tree", "ncdu", "ranger", "lf", "nnn",
+    "tokei", "hyperfine", "bandwhich", "bottom",
+    # Containers / orchestration
+    "docker-ce", "docker-compose", "podman", "buildah",
+    "kubectl", "helm", "k9s", "kubectx", "kubens",
+    "terraform", "ansible", "puppet", "chef",
+    # Databases (client packages)
+    "postgresql-client", "mysql-client", "sqlite3",
+    "redis-tools", "mongodb-clients",
+    # Libraries (commonly installed via system pkg manager)
+    "libssl-dev", "libffi-dev", "libpq-dev",
+    "zlib1g-dev", "libbz2-dev", "libreadline-dev",
+    "libsqlite3-dev", "libncurses-dev", "liblzma-dev",
+    "pkg-config", "libdbus-1-dev", "libglib2.0-dev",
+)
+
+
+def generate_system_packages() -> tuple[str, ...]:
     """Generate realistic system package names (apt/pacman/brew)."""
-    return [
-        # Core tools
-        "vim", "neovim", "nano", "emacs",
-        "git", "git-lfs", "tig", "lazygit",
-        "curl", "wget", "aria2", "httpie",
-        "htop", "btop", "glances", "nmon",
-        "tmux", "screen", "byobu", "zellij",
-        "zsh", "fish", "starship", "oh-my-zsh",
-        # Dev tools
-        "build-essential", "gcc", "g++", "clang", "llvm",
-        "cmake", "meson", "ninja-build", "autoconf", "automake",
-        "gdb", "lldb", "valgrind", "strace", "ltrace",
-        "python3", "python3-pip", "python3-venv", "python3-dev",
-        "nodejs", "npm", "yarn",
-        "rustup", "golang", "openjdk-17-jdk",
-        # Networking
-        "openssh-server", "openssh-client", "mosh",
-        "nmap", "netcat", "socat", "tcpdump", "wireshark",
-        "iptables", "nftables", "ufw", "firewalld",
-        "dnsutils", "bind-utils", "dig", "nslookup",
-        "iproute2", "net-tools", "traceroute", "mtr",
-        # System
-        "systemd", "cron", "logrotate", "rsyslog",
-        "lsof", "procps", "psmisc", "sysstat",
-        "e2fsprogs", "xfsprogs", "btrfs-progs", "lvm2",
-        "smartmontools", "hdparm", "nvme-cli",
-        # Modern CLI tools
-        "ripgrep", "fd-find", "bat", "exa", "eza",
-        "fzf", "delta", "dust", "duf", "procs",
-        "sd", "choose", "jq", "yq", "xsv",
-        "tree", "ncdu", "ranger", "lf", "nnn",
-        "tokei", "hyperfine", "bandwhich", "bottom",
-        # Containers / orchestration
-        "docker-ce", "docker-compose", "podman", "buildah",
-        "kubectl", "helm", "k9s", "kubectx", "kubens",
-        "terraform", "ansible", "puppet", "chef",
-        # Databases (client packages)
-        "postgresql-client", "mysql-client", "sqlite3",
-        "redis-tools", "mongodb-clients",
-        # Libraries (commonly installed via system pkg manager)
-        "libssl-dev", "libffi-dev", "libpq-dev",
-        "zlib1g-dev", "libbz2-dev", "libreadline-dev",
-        "libsqlite3-dev", "libncurses-dev", "liblzma-dev",
-        "pkg-config", "libdbus-1-dev", "libglib2.0-dev",
-    ]
+    return SYSTEM_PACKAGES
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Fetch real-world package/project names for training data augmentation"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help=f"Don't touch the network; use only responses cached in {CACHE_DIR}",
+    )
+    args = parser.parse_args()
+
     WORDLISTS_DIR.mkdir(parents=True, exist_ok=True)
     print(f"Writing wordlists to {WORDLISTS_DIR}/\n")
 
-    # Fetch from APIs
-    pypi_names = fetch_pypi_top()
-    npm_names = fetch_npm_top()
-    crate_names = fetch_crates_top()
+    # Fetch from APIs (concurrently — each is dominated by network latency)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        pypi_future = pool.submit(fetch_pypi_top, args.offline)
+        npm_future = pool.submit(fetch_npm_top, args.offline)
+        crates_future = pool.submit(fetch_crates_top, args.offline)
+    python_pkgs = pypi_future.result()
+    node_pkgs = npm_future.result()
+    rust_pkgs = crates_future.result()
 
     # Python packages: API results + fallback extras
-    python_pkgs = filter_names(pypi_names) if pypi_names else []
     if len(python_pkgs) < 200:
         print("  Adding fallback Python packages...")
         python_pkgs = filter_names(python_pkgs + [
@@ -322,7 +415,6 @@ def main():
     write_wordlist("packages-python", python_pkgs)
 
     # npm packages
-    node_pkgs = filter_names(npm_names) if npm_names else []
     if len(node_pkgs) < 200:
         print("  Adding fallback npm packages...")
         node_pkgs = filter_names(node_pkgs + [
@@ -338,7 +430,6 @@ def main():
     write_wordlist("packages-node", node_pkgs)
 
     # Rust crates
-    rust_pkgs = filter_names(crate_names) if crate_names else []
     if len(rust_pkgs) < 100:
         print("  Adding fallback Rust crates...")
         rust_pkgs = filter_names(rust_pkgs + [
@@ -3,7 +3,7 @@
 
 This script creates (command, error_output, correction) triples by:
 1. Using a curated set of known command/output scenarios that map to thefuck rules
-2. Attempting to invoke thefuck's match() and get_new_command() on each scenario
+2. Optionally (--use-thefuck) invoking thefuck's match() and get_new_command() on each scenario
 3. Falling back to the curated correction if the rule can't be invoked dynamically
 
 Output: JSONL with {"command": "...", "stderr": "...", "correction": "..."} per line.
@@ -13,12 +13,14 @@ Negative examples (unfixable commands) have expected_correction = None (serializ
 import argparse
 import importlib
 import json
-import sys
-from dataclasses import dataclass, field
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Scenario:
     """A command scenario that a thefuck rule would handle."""
 
@@ -33,38 +35,57 @@ class Scenario:
 # GIT SCENARIOS
 # ---------------------------------------------------------------------------
 
+# Shared by the git_push scenarios, which differ only in the branch name
+NO_UPSTREAM_OUTPUT = (
+    "fatal: The current branch {branch} has no upstream branch.\n"
+    "To push the current branch and set the remote as upstream, use\n\n"
+    "    git push --set-upstream origin {branch}\n"
+)
+
+GIT_TYPO_OUTPUT = (
+    "git: '{typo}' is not a git command. See 'git --help'.\n\n"
+    "The most similar command is\n\t{command}\n"
+)
+
+# (typo, intended subcommand, trailing arguments)
+GIT_TYPOS = (
+    ("psuh", "push", ""),
+    ("comit", "commit", ""),
+    ("stauts", "status", ""),
+    ("staus", "status", ""),
+    ("chekcout", "checkout", " main"),
+    ("merg", "merge", " feature-login"),
+    ("plul", "pull", ""),
+    ("dif", "diff", ""),
+    ("fetc", "fetch", ""),
+    ("lgo", "log", ""),
+    ("reabse", "rebase", " main"),
+    ("clon", "clone", " git@github.com:user/repo.git"),
+    ("intit", "init", ""),
+    ("rset", "reset", " HEAD~1"),
+    ("shwo", "show", ""),
+)
+
 GIT_SCENARIOS: list[Scenario] = [
     # --- push errors ---
     Scenario(
         rule_name="git_push",
         command="git push",
-        output=(
-            "fatal: The current branch feature-login has no upstream branch.\n"
-            "To push the current branch and set the remote as upstream, use\n\n"
-            "    git push --set-upstream origin feature-login\n"
-        ),
+        output=NO_UPSTREAM_OUTPUT.format(branch="feature-login"),
         expected_correction="git push --set-upstream origin feature-login",
         category="git",
     ),
     Scenario(
         rule_name="git_push",
         command="git push",
-        output=(
-            "fatal: The current branch fix-typo has no upstream branch.\n"
-            "To push the current branch and set the remote as upstream, use\n\n"
-            "    git push --set-upstream origin fix-typo\n"
-        ),
+        output=NO_UPSTREAM_OUTPUT.format(branch="fix-typo"),
         expected_correction="git push --set-upstream origin fix-typo",
         category="git",
     ),
     Scenario(
         rule_name="git_push",
         command="git push",
-        output=(
-            "fatal: The current branch develop has no upstream branch.\n"
-            "To push the current branch and set the remote as upstream, use\n\n"
-            "    git push --set-upstream origin develop\n"
-        ),
+        output=NO_UPSTREAM_OUTPUT.format(branch="develop"),
         expected_correction="git push --set-upstream origin develop",
         category="git",
     ),
@@ -488,155 +509,15 @@ GIT_SCENARIOS: list[Scenario] = [
         category="git",
     ),
     # --- typo in git command ---
-    Scenario(
-        rule_name="git_typo_psuh",
-        command="git psuh",
-        output=(
-            "git: 'psuh' is not a git command. See 'git --help'.\n\n"
-            "The most similar command is\n\tpush\n"
-        ),
-        expected_correction="git push",
-        category="git",
-    ),
-    Scenario(
-        rule_name="git_typo_comit",
-        command="git comit",
-        output=(
-            "git: 'comit' is not a git command. See 'git --help'.\n\n"
-            "The most similar command is\n\tcommit\n"
-        ),
-        expected_correction="git commit",
-        category="git",
-    ),
-    Scenario(
-        rule_name="git_typo_stauts",
-        command="git stauts",
-        output=(
-            "git: 'stauts' is not a git command. See 'git --help'.\n\n"
-            "The most similar command is\n\tstatus\n"
-        ),
-        expected_correction="git status",
-        category="git",
-    ),
-    Scenario(
-        rule_name="git_typo_staus",
-        command="git staus",
-        output=(
-            "git: 'staus' is not a git command. See 'git --help'.\n\n"
-            "The most similar command is\n\tstatus\n"
-        ),
-        expected_correction="git status",
-        category="git",
-    ),
-    Scenario(
-        rule_name="git_typo_chekcout",
-        command="git chekcout main",
-        output=(
-            "git: 'chekcout' is not a git command. See 'git --help'.\n\n"
-            "The most similar command is\n\tcheckout\n"
-        ),
-        expected_correction="git checkout main",
-        category="git",
-    ),
-    Scenario(
-        rule_name="git_typo_merg",
-        command="git merg feature-login",
-        output=(
-            "git: 'merg' is not a git command. See 'git --help'.\n\n"
-            "The most similar command is\n\tmerge\n"
-        ),
-        expected_correction="git merge feature-login",
-        category="git",
-    ),
-    Scenario(
-        rule_name="git_typo_plul",
-        command="git plul",
-        output=(
-            "git: 'plul' is not a git command. See 'git --help'.\n\n"
-            "The most similar command is\n\tpull\n"
-        ),
-        expected_correction="git pull",
-        category="git",
-    ),
-    Scenario(
-        rule_name="git_typo_dif",
-        command="git dif",
-        output=(
-            "git: 'dif' is not a git command. See 'git --help'.\n\n"
-            "The most similar command is\n\tdiff\n"
-        ),
-        expected_correction="git diff",
-        category="git",
-    ),
-    Scenario(
-        rule_name="git_typo_fetc",
-        command="git fetc",
-        output=(
-            "git: 'fetc' is not a git command. See 'git --help'.\n\n"
-            "The most similar command is\n\tfetch\n"
-        ),
-        expected_correction="git fetch",
-        category="git",
-    ),
-    Scenario(
-        rule_name="git_typo_lgo",
-        command="git lgo",
-        output=(
-            "git: 'lgo' is not a git command. See 'git --help'.\n\n"
-            "The most similar command is\n\tlog\n"
-        ),
-        expected_correction="git log",
-        category="git",
-    ),
-    Scenario(
-        rule_name="git_typo_reabse",
-        command="git reabse main",
-        output=(
-            "git: 'reabse' is not a git command. See 'git --help'.\n\n"
-            "The most similar command is\n\trebase\n"
-        ),
-        expected_correction="git rebase main",
-        category="git",
-    ),
-    Scenario(
-        rule_name="git_typo_clon",
-        command="git clon git@github.com:user/repo.git",
-        output=(
-            "git: 'clon' is not a git command. See 'git --help'.\n\n"
-            "The most similar command is\n\tclone\n"
-        ),
-        expected_correction="git clone git@github.com:user/repo.git",
-        category="git",
-    ),
-    Scenario(
-        rule_name="git_typo_intit",
-        command="git intit",
-        output=(
-            "git: 'intit' is not a git command. See 'git --help'.\n\n"
-            "The most similar command is\n\tinit\n"
-        ),
-        expected_correction="git init",
-        category="git",
-    ),
-    Scenario(
-        rule_name="git_typo_rset",
-        command="git rset HEAD~1",
-        output=(
-            "git: 'rset' is not a git command. See 'git --help'.\n\n"
-            "The most similar command is\n\treset\n"
-        ),
-        expected_correction="git reset HEAD~1",
-        category="git",
-    ),
-    Scenario(
-        rule_name="git_typo_shwo",
-        command="git shwo",
-        output=(
-            "git: 'shwo' is not a git command. See 'git --help'.\n\n"
-            "The most similar command is\n\tshow\n"
-        ),
-        expected_correction="git show",
-        category="git",
+    *(
+        Scenario(
+            rule_name=f"git_typo_{typo}",
+            command=f"git {typo}{args}",
+            output=GIT_TYPO_OUTPUT.format(typo=typo, command=command),
+            expected_correction=f"git {command}{args}",
+            category="git",
+        )
+        for typo, command, args in GIT_TYPOS
     ),
     # --- multi-alternative: push diverged ---
     Scenario(
@@ -755,6 +636,17 @@ GIT_SCENARIOS: list[Scenario] = [
 # PACKAGE MANAGER SCENARIOS
 # ---------------------------------------------------------------------------
 
+# Shared by the npm_wrong_command scenarios for mistyped script names
+NPM_MISSING_SCRIPT_OUTPUT = (
+    'npm error Missing script: "{script}"\n\n'
+    "npm error To see a list of scripts, run:\n"
+    "npm error   npm run\n\n"
+    "npm error Did you mean this?\n  npm run {suggestion}\n"
+)
+
+# pacman's refusal to run a privileged operation as a normal user
+PACMAN_ROOT_ERROR = "error: you cannot perform this operation unless you are root.\n"
+
 PACKAGE_MANAGER_SCENARIOS: list[Scenario] = [
     # --- pip ---
     Scenario(
@@ -874,36 +766,21 @@ PACKAGE_MANAGER_SCENARIOS: list[Scenario] = [
     Scenario(
         rule_name="npm_wrong_command",
         command="npm run biuld",
-        output=(
-            'npm error Missing script: "biuld"\n\n'
-            "npm error To see a list of scripts, run:\n"
-            "npm error   npm run\n\n"
-            'npm error Did you mean this?\n  npm run build\n'
-        ),
+        output=NPM_MISSING_SCRIPT_OUTPUT.format(script="biuld", suggestion="build"),
         expected_correction="npm run build",
         category="package_manager",
     ),
     Scenario(
         rule_name="npm_wrong_command",
         command="npm run statr",
-        output=(
-            'npm error Missing script: "statr"\n\n'
-            "npm error To see a list of scripts, run:\n"
-            "npm error   npm run\n\n"
-            'npm error Did you mean this?\n  npm run start\n'
-        ),
+        output=NPM_MISSING_SCRIPT_OUTPUT.format(script="statr", suggestion="start"),
         expected_correction="npm run start",
         category="package_manager",
     ),
     Scenario(
         rule_name="npm_wrong_command",
         command="npm run tset",
-        output=(
-            'npm error Missing script: "tset"\n\n'
-            "npm error To see a list of scripts, run:\n"
-            "npm error   npm run\n\n"
-            'npm error Did you mean this?\n  npm run test\n'
-        ),
+        output=NPM_MISSING_SCRIPT_OUTPUT.format(script="tset", suggestion="test"),
         expected_correction="npm run test",
         category="package_manager",
     ),
@@ -1102,7 +979,7 @@ PACKAGE_MANAGER_SCENARIOS: list[Scenario] = [
     Scenario(
         rule_name="pacman_permission",
         command="pacman -Syu",
-        output="error: you cannot perform this operation unless you are root.\n",
+        output=PACMAN_ROOT_ERROR,
         expected_correction="sudo pacman -Syu",
         category="package_manager",
     ),
@@ -1658,14 +1535,23 @@ COMMAND_NOT_FOUND_SCENARIOS: list[Scenario] = [
 # PERMISSION / SUDO SCENARIOS
 # ---------------------------------------------------------------------------
 
+# ssh's refusal to use a private key readable by other users
+SSH_UNPROTECTED_KEY_BANNER = (
+    "@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@\n"
+    "@         WARNING: UNPROTECTED PRIVATE KEY FILE!          @\n"
+    "@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@\n"
+)
+
+# pacman operations attempted without sudo
+PACMAN_PERMISSION_ARGS = (
+    "-S git",
+    "-S openssh",
+    "-S discord",
+    "-Rns firefox",
+    "-S pavucontrol",
+)
+
 PERMISSION_SCENARIOS: list[Scenario] = [
-    Scenario(
-        rule_name="no_such_file",
-        command="cat /var/log/syslog",
-        output="cat: /var/log/syslog: Permission denied\n",
-        expected_correction="sudo cat /var/log/syslog",
-        category="permissions",
-    ),
     Scenario(
         rule_name="no_such_file",
         command="cat /etc/shadow",
@@ -1712,13 +1598,6 @@ PERMISSION_SCENARIOS: list[Scenario] = [
         expected_correction="sudo systemctl enable nginx",
         category="permissions",
     ),
-    Scenario(
-        rule_name="mkdir_permission",
-        command="mkdir /opt/myapp",
-        output="mkdir: cannot create directory '/opt/myapp': Permission denied\n",
-        expected_correction="sudo mkdir /opt/myapp",
-        category="permissions",
-    ),
     Scenario(
         rule_name="mkdir_permission",
         command="mkdir /usr/local/lib/mylib",
@@ -1764,10 +1643,8 @@ PERMISSION_SCENARIOS: list[Scenario] = [
         rule_name="ssh_permission",
         command="ssh user@host",
         output=(
-            "@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@\n"
-            "@         WARNING: UNPROTECTED PRIVATE KEY FILE!          @\n"
-            "@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@\n"
-            "Permissions 0644 for '/home/user/.ssh/id_rsa' are too open.\n"
+            SSH_UNPROTECTED_KEY_BANNER
+            + "Permissions 0644 for '/home/user/.ssh/id_rsa' are too open.\n"
         ),
         expected_correction="chmod 600 ~/.ssh/id_rsa && ssh user@host",
         category="permissions",
@@ -1776,10 +1653,8 @@ PERMISSION_SCENARIOS: list[Scenario] = [
         rule_name="ssh_permission",
         command="ssh alice@server01",
         output=(
-            "@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@\n"
-            "@         WARNING: UNPROTECTED PRIVATE KEY FILE!          @\n"
-            "@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@\n"
-            "Permissions 0640 for '/home/alice/.ssh/id_ed25519' are too open.\n"
+            SSH_UNPROTECTED_KEY_BANNER
+            + "Permissions 0640 for '/home/alice/.ssh/id_ed25519' are too open.\n"
         ),
         expected_correction="chmod 600 ~/.ssh/id_ed25519 && ssh alice@server01",
         category="permissions",
@@ -1830,40 +1705,15 @@ PERMISSION_SCENARIOS: list[Scenario] = [
         category="permissions",
     ),
     # --- pacman without sudo (various operations) ---
-    Scenario(
-        rule_name="pacman_permission",
-        command="pacman -S git",
-        output="error: you cannot perform this operation unless you are root.\n",
-        expected_correction="sudo pacman -S git",
-        category="permissions",
-    ),
-    Scenario(
-        rule_name="pacman_permission",
-        command="pacman -S openssh",
-        output="error: you cannot perform this operation unless you are root.\n",
-        expected_correction="sudo pacman -S openssh",
-        category="permissions",
-    ),
-    Scenario(
-        rule_name="pacman_permission",
-        command="pacman -S discord",
-        output="error: you cannot perform this operation unless you are root.\n",
-        expected_correction="sudo pacman -S discord",
-        category="permissions",
-    ),
-    Scenario(
-        rule_name="pacman_permission",
-        command="pacman -Rns firefox",
-        output="error: you cannot perform this operation unless you are root.\n",
-        expected_correction="sudo pacman -Rns firefox",
-        category="permissions",
-    ),
-    Scenario(
-        rule_name="pacman_permission",
-        command="pacman -S pavucontrol",
-        output="error: you cannot perform this operation unless you are root.\n",
-        expected_correction="sudo pacman -S pavucontrol",
-        category="permissions",
+    *(
+        Scenario(
+            rule_name="pacman_permission",
+            command=f"pacman {args}",
+            output=PACMAN_ROOT_ERROR,
+            expected_correction=f"sudo pacman {args}",
+            category="permissions",
+        )
+        for args in PACMAN_PERMISSION_ARGS
     ),
     # --- system admin tools without sudo ---
     Scenario(
@@ -1938,24 +1788,24 @@ PERMISSION_SCENARIOS: list[Scenario] = [
 # NETWORK / SERVICE SCENARIOS
 # ---------------------------------------------------------------------------
 
+# Shared by the docker_not_running scenarios here and in DOCKER_SCENARIOS
+DOCKER_NOT_RUNNING_ERROR = (
+    "Cannot connect to the Docker daemon at unix:///var/run/docker.sock. "
+    "Is the docker daemon running?\n"
+)
+
 NETWORK_SCENARIOS: list[Scenario] = [
     Scenario(
         rule_name="docker_not_running",
         command="docker ps",
-        output=(
-            "Cannot connect to the Docker daemon at unix:///var/run/docker.sock. "
-            "Is the docker daemon running?\n"
-        ),
+        output=DOCKER_NOT_RUNNING_ERROR,
         expected_correction="sudo systemctl start docker && docker ps",
         category="network",
     ),
     Scenario(
         rule_name="docker_not_running",
         command="docker build -t myapp .",
-        output=(
-            "Cannot connect to the Docker daemon at unix:///var/run/docker.sock. "
-            "Is the docker daemon running?\n"
-        ),
+        output=DOCKER_NOT_RUNNING_ERROR,
         expected_correction="sudo systemctl start docker && docker build -t myapp .",
         category="network",
     ),
@@ -2192,6 +2042,24 @@ RUNTIME_SCENARIOS: list[Scenario] = [
 # GENERAL / MISCELLANEOUS SCENARIOS
 # ---------------------------------------------------------------------------
 
+# Commands typed with a redundant second sudo
+DOUBLE_SUDO_COMMANDS = (
+    "reboot",
+    "pacman -Syu",
+    "systemctl restart nginx",
+    "mount /dev/sda1 /mnt",
+)
+
+# (name from another distro, Arch package name)
+PACMAN_RENAMED_PACKAGES = (
+    ("openssh-server", "openssh"),
+    ("sshd", "openssh"),
+    ("python3", "python"),
+    ("python3-pip", "python-pip"),
+    ("libssl-dev", "openssl"),
+    ("build-essential", "base-devel"),
+)
+
 GENERAL_SCENARIOS: list[Scenario] = [
     Scenario(
         rule_name="grep_r",
@@ -2370,76 +2238,26 @@ GENERAL_SCENARIOS: list[Scenario] = [
         category="general",
     ),
     # --- double sudo ---
-    Scenario(
-        rule_name="double_sudo",
-        command="sudo sudo reboot",
-        output="sudo: sudo: command not found\n",
-        expected_correction="sudo reboot",
-        category="general",
-    ),
-    Scenario(
-        rule_name="double_sudo",
-        command="sudo sudo pacman -Syu",
-        output="sudo: sudo: command not found\n",
-        expected_correction="sudo pacman -Syu",
-        category="general",
-    ),
-    Scenario(
-        rule_name="double_sudo",
-        command="sudo sudo systemctl restart nginx",
-        output="sudo: sudo: command not found\n",
-        expected_correction="sudo systemctl restart nginx",
-        category="general",
-    ),
-    Scenario(
-        rule_name="double_sudo",
-        command="sudo sudo mount /dev/sda1 /mnt",
-        output="sudo: sudo: command not found\n",
-        expected_correction="sudo mount /dev/sda1 /mnt",
-        category="general",
+    *(
+        Scenario(
+            rule_name="double_sudo",
+            command=f"sudo sudo {command}",
+            output="sudo: sudo: command not found\n",
+            expected_correction=f"sudo {command}",
+            category="general",
+        )
+        for command in DOUBLE_SUDO_COMMANDS
     ),
     # --- wrong package names (distro confusion) ---
-    Scenario(
-        rule_name="pacman_wrong_pkg_name",
-        command="sudo pacman -S openssh-server",
-        output="error: target not found: openssh-server\n",
-        expected_correction="sudo pacman -S openssh",
-        category="general",
-    ),
-    Scenario(
-        rule_name="pacman_wrong_pkg_name",
-        command="sudo pacman -S sshd",
-        output="error: target not found: sshd\n",
-        expected_correction="sudo pacman -S openssh",
-        category="general",
-    ),
-    Scenario(
-        rule_name="pacman_wrong_pkg_name",
-        command="sudo pacman -S python3",
-        output="error: target not found: python3\n",
-        expected_correction="sudo pacman -S python",
-        category="general",
-    ),
-    Scenario(
-        rule_name="pacman_wrong_pkg_name",
-        command="sudo pacman -S python3-pip",
-        output="error: target not found: python3-pip\n",
-        expected_correction="sudo pacman -S python-pip",
-        category="general",
-    ),
-    Scenario(
-        rule_name="pacman_wrong_pkg_name",
-        command="sudo pacman -S libssl-dev",
-        output="error: target not found: libssl-dev\n",
-        expected_correction="sudo pacman -S openssl",
-        category="general",
-    ),
-    Scenario(
-        rule_name="pacman_wrong_pkg_name",
-        command="sudo pacman -S build-essential",
-        output="error: target not found: build-essential\n",
-        expected_correction="sudo pacman -S base-devel",
-        category="general",
+    *(
+        Scenario(
+            rule_name="pacman_wrong_pkg_name",
+            command=f"sudo pacman -S {wrong}",
+            output=f"error: target not found: {wrong}\n",
+            expected_correction=f"sudo pacman -S {right}",
+            category="general",
+        )
+        for wrong, right in PACMAN_RENAMED_PACKAGES
     ),
     # --- pacman package name typos ---
     Scenario(
@@ -2480,10 +2298,7 @@ DOCKER_SCENARIOS: list[Scenario] = [
     Scenario(
         rule_name="docker_not_running",
         command="docker images",
-        output=(
-            "Cannot connect to the Docker daemon at unix:///var/run/docker.sock. "
-            "Is the docker daemon running?\n"
-        ),
+        output=DOCKER_NOT_RUNNING_ERROR,
         expected_correction=[
             "sudo systemctl start docker && docker images",
             "sudo dockerd &",
@@ -2570,13 +2385,6 @@ DOCKER_SCENARIOS: list[Scenario] = [
 # ---------------------------------------------------------------------------
 
 KUBERNETES_SCENARIOS: list[Scenario] = [
-    Scenario(
-        rule_name="kubectl_not_found",
-        command="kubeclt get pods",
-        output="bash: kubeclt: command not found\n",
-        expected_correction="kubectl get pods",
-        category="kubernetes",
-    ),
     Scenario(
         rule_name="kubectl_context",
         command="kubectl get pods",
@@ -2620,18 +2428,18 @@ KUBERNETES_SCENARIOS: list[Scenario] = [
 # ORIGINAL SCENARIOS (kept for backward compat)
 # ---------------------------------------------------------------------------
 
-SCENARIOS: list[Scenario] = (
-    GIT_SCENARIOS
-    + PACKAGE_MANAGER_SCENARIOS
-    + FILE_SCENARIOS
-    + COMMAND_NOT_FOUND_SCENARIOS
-    + PERMISSION_SCENARIOS
-    + NETWORK_SCENARIOS
-    + RUNTIME_SCENARIOS
-    + GENERAL_SCENARIOS
-    + DOCKER_SCENARIOS
-    + KUBERNETES_SCENARIOS
-)
+SCENARIOS: tuple[Scenario, ...] = tuple(chain(
+    GIT_SCENARIOS,
+    PACKAGE_MANAGER_SCENARIOS,
+    FILE_SCENARIOS,
+    COMMAND_NOT_FOUND_SCENARIOS,
+    PERMISSION_SCENARIOS,
+    NETWORK_SCENARIOS,
+    RUNTIME_SCENARIOS,
+    GENERAL_SCENARIOS,
+    DOCKER_SCENARIOS,
+    KUBERNETES_SCENARIOS,
+))
 
 # Negative examples: commands that are unfixable.
 NEGATIVE_SCENARIOS: list[Scenario] = [
@@ -2787,36 +2595,58 @@ NEGATIVE_SCENARIOS: list[Scenario] = [
     ),
 ]
 
+# Everything generate_examples() emits, positives first
+ALL_SCENARIOS: tuple[Scenario, ...] = (*SCENARIOS, *NEGATIVE_SCENARIOS)
 
-def try_thefuck_rule(rule_name: str, command_str: str, output: str) -> str | None:
-    """Try to invoke a thefuck rule dynamically and return the correction.
 
-    Returns None if the rule can't be loaded or doesn't match.
+# A minimal stand-in for thefuck's Command. We avoid importing from
+# thefuck.types to reduce dependency on thefuck internals that may require
+# shell init.
+class MinimalCommand:
+    def __init__(self, script, output):
+        self.script = script
+        self.output = output
+
+    @property
+    def script_parts(self):
+        return self.script.split()
+
+
+@lru_cache(maxsize=None)
+def load_rule(rule_name: str):
+    """Load thefuck.rules.<rule_name> once and return its (match, get_new_command).
+
+    Returns None if the rule can't be imported or lacks either function.
+    Failed imports aren't cached by the import system, so without this every
+    scenario for a missing rule would search sys.path again.
     """
     try:
         mod = importlib.import_module(f"thefuck.rules.{rule_name}")
     except (ImportError, ModuleNotFoundError):
         return None
 
-    if not hasattr(mod, "match") or not hasattr(mod, "get_new_command"):
+    match = getattr(mod, "match", None)
+    get_new_command = getattr(mod, "get_new_command", None)
+    if match is None or get_new_command is None:
         return None
+    return match, get_new_command
 
-    # Build a minimal Command object. We avoid importing from thefuck.types
-    # to reduce dependency on thefuck internals that may require shell init.
-    class MinimalCommand:
-        def __init__(self, script, output):
-            self.script = script
-            self.output = output
 
-        @property
-        def script_parts(self):
-            return self.script.split()
+def try_thefuck_rule(rule_name: str, command_str: str, output: str) -> str | None:
+    """Try to invoke a thefuck rule dynamically and return the correction.
+
+    Returns None if the rule can't be loaded or doesn't match.
+    """
+    rule = load_rule(rule_name)
+    if rule is None:
+        return None
+    match, get_new_command = rule
 
     cmd = MinimalCommand(command_str, output)
 
     try:
-        if mod.match(cmd):
-            result = mod.get_new_command(cmd)
+        if match(cmd):
+            result = get_new_command(cmd)
             if isinstance(result, list):
                 return result[0]
             return result
@@ -2826,19 +2656,29 @@ def try_thefuck_rule(rule_name: str, command_str: str, output: str) -> str | Non
     return None
 
 
-def generate_examples(use_thefuck: bool = True) -> list[dict]:
+def generate_examples(use_thefuck: bool = False) -> list[dict]:
     """Generate all training examples.
 
     Args:
         use_thefuck: If True, try to use thefuck rules dynamically for corrections.
-                     Falls back to curated corrections either way.
+                     Falls back to curated corrections either way. Off by
+                     default, since the curated corrections are authoritative.
+
+    Scenarios that repeat an earlier (command, output) pair are skipped, so the
+    same example isn't emitted twice when it's listed under several categories.
 
     Returns:
         List of {"command": ..., "stderr": ..., "correction": ...} dicts.
     """
     examples = []
+    seen: set[tuple[str, str]] = set()
+
+    for scenario in ALL_SCENARIOS:
+        key = (scenario.command, scenario.output)
+        if key in seen:
+            continue
+        seen.add(key)
 
-    for scenario in SCENARIOS + NEGATIVE_SCENARIOS:
         correction = scenario.expected_correction
 
         # Normalize list corrections to newline-separated string
@@ -2874,10 +2714,17 @@ def main():
         default=Path("data/base_examples.jsonl"),
         help="Output JSONL file path (default: data/base_examples.jsonl)",
     )
-    parser.add_argument(
-        "--no-thefuck",
+    thefuck = parser.add_mutually_exclusive_group()
+    thefuck.add_argument(
+        "--use-thefuck",
         action="store_true",
-        help="Don't try to use thefuck rules dynamically, use curated corrections only",
+        help="Try installed thefuck rules dynamically before the curated corrections",
+    )
+    thefuck.add_argument(
+        "--no-thefuck",
+        dest="use_thefuck",
+        action="store_false",
+        help="Use curated corrections only (the default)",
     )
     parser.add_argument(
         "--stats",
@@ -2888,11 +2735,10 @@ def main():
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
 
-    examples = generate_examples(use_thefuck=not args.no_thefuck)
+    examples = generate_examples(use_thefuck=args.use_thefuck)
 
-    with open(args.output, "w") as f:
-        for ex in examples:
-            f.write(json.dumps(ex) + "\n")
+    # The base set is small enough to assemble in memory and write once
+    args.output.write_text("".join(json.dumps(ex) + "\n" for ex in examples))
 
     n_positive = sum(1 for ex in examples if ex["correction"] != "?")
     n_negative = sum(1 for ex in examples if ex["correction"] == "?")
@@ -2904,12 +2750,10 @@ def main():
 
     if args.stats:
         # Count by category
-        categories: dict[str, int] = {}
-        n_multi = 0
-        for s in SCENARIOS + NEGATIVE_SCENARIOS:
-            categories[s.category] = categories.get(s.category, 0) + 1
-            if isinstance(s.expected_correction, list):
-                n_multi += 1
+        categories = Counter(s.category for s in ALL_SCENARIOS)
+        n_multi = sum(
+            1 for s in ALL_SCENARIOS if isinstance(s.expected_correction, list)
+        )
         print("\nBy category:")
         for cat, count in sorted(categories.items()):
             print(f"  {cat}: {count}")
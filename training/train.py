@@ -15,7 +15,12 @@ Model input format:
 """
 
 import argparse
+import hashlib
 import json
+import os
+import shutil
+import time
+from functools import partial
 from pathlib import Path
 
 import torch
@@ -23,32 +28,50 @@ from datasets import Dataset
 from transformers import (
     AutoModelForCausalLM,
     AutoTokenizer,
+    DataCollatorForSeq2Seq,
     Trainer,
     TrainingArguments,
 )
 
+TOKENIZED_CACHE_DIR = Path.home() / ".cache" / "shit-training" / "tokenized"
 
-def format_example(example: dict) -> str:
-    """Format a training example into the prompt format the model will learn.
+# Most recently used tokenized datasets kept in the cache: the current train
+# and eval sets plus the previous pair, so switching back is still free
+TOKENIZED_CACHE_KEEP = 4
 
-    Format:
-        $ {command}
-        > {stderr}
-        OP: REPLACE old new
+# Columns written by tokenize_dataset(); part of the cache key so a layout
+# change never reloads an old cached dataset
+TOKENIZED_COLUMNS = ("input_ids", "attention_mask", "labels", "length")
+
+
+def format_prompt(example: dict) -> str:
+    """Format the prompt half of an example, up to and including 'OP: '.
+
+    Stderr is capped at 512 characters and each line is prefixed with '> '.
     """
     parts = [f"$ {example['command']}"]
     if example.get("stderr"):
         stderr = example["stderr"]
         if len(stderr) > 512:
             stderr = stderr[:512] + "..."
-        for line in stderr.splitlines():
-            parts.append(f"> {line}")
+        parts.extend(f"> {line}" for line in stderr.splitlines())
 
-    parts.append(f"OP: {example['op']}")
+    parts.append("OP: ")
 
     return "\n".join(parts)
 
 
+def format_example(example: dict) -> str:
+    """Format a training example into the prompt format the model will learn.
+
+    Format:
+        $ {command}
+        > {stderr}
+        OP: REPLACE old new
+    """
+    return format_prompt(example) + example["op"]
+
+
 def load_training_data(data_path: Path) -> list[dict]:
     """Load JSONL training data."""
     examples = []
@@ -61,52 +84,62 @@ def load_training_data(data_path: Path) -> list[dict]:
 
 
 def tokenize_dataset(
-    examples: list[dict], tokenizer, max_length: int
+    examples: list[dict], tokenizer, max_length: int, cache_dir: Path | None = None
 ) -> Dataset:
     """Tokenize training examples into a HuggingFace Dataset.
 
     Each example is formatted into the prompt format and tokenized.
     Labels are masked (-100) for the prompt portion so the model only learns
     to predict the operation after 'OP: ', not the prompt itself.
+
+    With cache_dir set, the result is saved there keyed by a hash of the
+    formatted texts, tokenizer and max_length, and reloaded on later runs.
+    Only the TOKENIZED_CACHE_KEEP most recently used entries are kept.
     """
+    # Build prompt and completion separately
+    prompt_texts = [format_prompt(ex) for ex in examples]
+    completion_texts = [ex["op"] + tokenizer.eos_token for ex in examples]
+
+    cache_path = None
+    if cache_dir is not None:
+        key = hashlib.sha256(
+            json.dumps(
+                [TOKENIZED_COLUMNS, tokenizer.name_or_path, len(tokenizer),
+                 max_length, prompt_texts, completion_texts]
+            ).encode()
+        ).hexdigest()
+        cache_path = cache_dir / key
+        if cache_path.exists():
+            # Mark as recently used so pruning keeps it
+            os.utime(cache_path)
+            return Dataset.load_from_disk(str(cache_path))
+
+    # Tokenize prompts and completions SEPARATELY to avoid the tokenizer
+    # merging tokens across the boundary. Passing whole lists lets the fast
+    # tokenizer encode them as one batch instead of two calls per example.
+    prompt_tok = tokenizer(
+        prompt_texts,
+        truncation=True,
+        max_length=max_length,
+        padding=False,
+        add_special_tokens=False,
+    )
+    completion_tok = tokenizer(
+        completion_texts,
+        padding=False,
+        add_special_tokens=False,
+    )
+
     all_input_ids = []
     all_attention_mask = []
     all_labels = []
+    all_lengths = []
 
-    for ex in examples:
-        # Build prompt and completion separately
-        parts = [f"$ {ex['command']}"]
-        if ex.get("stderr"):
-            stderr = ex["stderr"]
-            if len(stderr) > 512:
-                stderr = stderr[:512] + "..."
-            for line in stderr.splitlines():
-                parts.append(f"> {line}")
-
-        parts.append("OP: ")
-        completion_text = ex["op"] + tokenizer.eos_token
-
-        prompt_text = "\n".join(parts)
-
-        # Tokenize prompt and completion SEPARATELY to avoid
-        # tokenizer merging tokens across the boundary
-        prompt_tok = tokenizer(
-            prompt_text,
-            truncation=True,
-            max_length=max_length,
-            padding=False,
-            add_special_tokens=False,
-        )
-        completion_tok = tokenizer(
-            completion_text,
-            truncation=True,
-            max_length=max_length - len(prompt_tok["input_ids"]),
-            padding=False,
-            add_special_tokens=False,
-        )
-
-        prompt_ids = prompt_tok["input_ids"]
-        completion_ids = completion_tok["input_ids"]
+    for prompt_ids, completion_ids in zip(
+        prompt_tok["input_ids"], completion_tok["input_ids"]
+    ):
+        # Completions get whatever room the prompt leaves
+        completion_ids = completion_ids[: max_length - len(prompt_ids)]
         input_ids = prompt_ids + completion_ids
         attention_mask = [1] * len(input_ids)
         prompt_len = len(prompt_ids)
@@ -117,13 +150,65 @@ def tokenize_dataset(
         all_input_ids.append(input_ids)
         all_attention_mask.append(attention_mask)
         all_labels.append(labels)
+        all_lengths.append(len(input_ids))
 
-    return Dataset.from_dict({
+    dataset = Dataset.from_dict({
         "input_ids": all_input_ids,
         "attention_mask": all_attention_mask,
         "labels": all_labels,
+        # Read by the length-grouped sampler instead of re-measuring input_ids
+        "length": all_lengths,
     })
 
+    if cache_path is not None:
+        # Save under a per-process temp name and rename, so an interrupted
+        # save is never reused and concurrent runs don't share a temp dir
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        dataset.save_to_disk(str(tmp))
+        try:
+            tmp.rename(cache_path)
+        except OSError:
+            if not cache_path.exists():
+                raise
+            # Another run cached the same key first; its copy is identical
+            shutil.rmtree(tmp, ignore_errors=True)
+        prune_tokenized_cache(cache_path.parent)
+
+    return dataset
+
+
+def prune_tokenized_cache(cache_dir: Path, keep: int = TOKENIZED_CACHE_KEEP):
+    """Delete all but the `keep` most recently used cached datasets.
+
+    Temp directories left behind by interrupted saves are removed once they
+    are a day old; younger ones may belong to a run that is still saving.
+    """
+    entries = []
+    for path in cache_dir.iterdir():
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            continue  # removed by a concurrent run
+        if path.name.endswith(".tmp"):
+            if time.time() - mtime > 24 * 60 * 60:
+                shutil.rmtree(path, ignore_errors=True)
+        else:
+            entries.append((mtime, path))
+
+    entries.sort(reverse=True)
+    for _, path in entries[keep:]:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def collate_without_length(collator, features: list[dict]) -> dict:
+    """Drop the length column, which only feeds the length-grouped sampler.
+
+    Module-level (bound with functools.partial) so DataLoader workers can
+    pickle it under the spawn start method.
+    """
+    return collator([{k: v for k, v in f.items() if k != "length"} for f in features])
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -209,6 +294,30 @@ def main():
         default=1,
         help="Gradient accumulation steps (default: 1)",
     )
+    parser.add_argument(
+        "--dataloader-workers",
+        type=int,
+        default=4,
+        help="DataLoader worker processes, kept alive across epochs "
+             "(default: 4; 0 collates in the main process)",
+    )
+    parser.add_argument(
+        "--attn-implementation",
+        choices=["eager", "sdpa", "flash_attention_2"],
+        default="sdpa",
+        help="Attention kernel (default: sdpa; flash_attention_2 needs "
+             "`pip install flash-attn`)",
+    )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Compile the model with torch.compile (faster steps after a slow first one)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-tokenize instead of reusing datasets cached in {TOKENIZED_CACHE_DIR}",
+    )
     args = parser.parse_args()
 
     if not args.data.exists():
@@ -234,18 +343,22 @@ def main():
     # Gemma may not have a pad token set
     if tokenizer.pad_token is None:
         tokenizer.pad_token = tokenizer.eos_token
+    # Pad after the completion so prompt token positions match inference
+    tokenizer.padding_side = "right"
 
     model = AutoModelForCausalLM.from_pretrained(
         args.model_name,
         dtype=torch.bfloat16 if args.bf16 else torch.float32,
+        attn_implementation=args.attn_implementation,
     )
 
     print(f"Model parameters: {model.num_parameters():,}")
 
     # Tokenize
     print("Tokenizing datasets...")
-    train_dataset = tokenize_dataset(train_examples, tokenizer, args.max_length)
-    eval_dataset = tokenize_dataset(eval_examples, tokenizer, args.max_length) if eval_examples else None
+    cache_dir = None if args.no_cache else TOKENIZED_CACHE_DIR
+    train_dataset = tokenize_dataset(train_examples, tokenizer, args.max_length, cache_dir)
+    eval_dataset = tokenize_dataset(eval_examples, tokenizer, args.max_length, cache_dir) if eval_examples else None
     print(f"Train: {len(train_dataset)} examples" + (f", Eval: {len(eval_dataset)} examples" if eval_dataset else ""))
 
     # Training arguments
@@ -269,19 +382,29 @@ def main():
         seed=args.seed,
         report_to="none",  # Disable wandb etc. by default
         dataloader_pin_memory=True,
+        dataloader_num_workers=args.dataloader_workers,
+        dataloader_persistent_workers=args.dataloader_workers > 0,
+        # Batch examples of similar length together so short examples
+        # aren't padded out to the longest prompt in a random batch
+        train_sampling_strategy="group_by_length",
+        length_column_name="length",
+        # Trainer would otherwise drop the length column (it isn't a model
+        # input) before the sampler sees it; data_collator drops it instead
+        remove_unused_columns=False,
+        torch_compile=args.compile,
+    )
+
+    # Pads input_ids, attention_mask, and labels to a multiple of 8 tokens
+    # (tensor-core friendly). Labels are padded with -100 (ignored in
+    # cross-entropy loss)
+    seq2seq_collator = DataCollatorForSeq2Seq(
+        tokenizer,
+        label_pad_token_id=-100,
+        pad_to_multiple_of=8,
+        return_tensors="pt",
     )
 
-    # Custom data collator that pads input_ids, attention_mask, and labels
-    # Labels are padded with -100 (ignored in cross-entropy loss)
-    def data_collator(features):
-        max_len = max(len(f["input_ids"]) for f in features)
-        batch = {"input_ids": [], "attention_mask": [], "labels": []}
-        for f in features:
-            pad_len = max_len - len(f["input_ids"])
-            batch["input_ids"].append(f["input_ids"] + [tokenizer.pad_token_id] * pad_len)
-            batch["attention_mask"].append(f["attention_mask"] + [0] * pad_len)
-            batch["labels"].append(f["labels"] + [-100] * pad_len)
-        return {k: torch.tensor(v) for k, v in batch.items()}
+    data_collator = partial(collate_without_length, seq2seq_collator)
 
     # Initialize trainer
     trainer = Trainer(